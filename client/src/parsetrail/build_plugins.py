@@ -32,6 +32,12 @@ PROJECT_ENV = _load_project_env()
 PLUGINS_DIR = Path(PROJECT_ENV.get("PLUGINS_DIR")).expanduser()
 
 
+def source_signature() -> tuple[tuple[str, int, int], ...]:
+    """Name, mtime and size of every plugin source, for detecting edits since the last build."""
+    stats = ((plugin_file.name, plugin_file.stat()) for plugin_file in SOURCE_DIR.glob("*.py"))
+    return tuple(sorted((name, stat.st_mtime_ns, stat.st_size) for name, stat in stats))
+
+
 def compile_plugins():
     PLUGINS_DIR.mkdir(parents=True, exist_ok=True)
     for plugin_file in SOURCE_DIR.glob("*.py"):
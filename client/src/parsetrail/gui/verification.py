@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List, Optional
 
+import numpy as np
 import pandas as pd
 from loguru import logger
 from parsetrail.core.categorize import transactions as categorize_transactions
@@ -541,7 +542,7 @@ class TransactionReviewWindow(QtWidgets.QMainWindow):
                 )
 
             self.model.set_records(records)
-            self._resize_columns()
+            QtCore.QTimer.singleShot(0, self._resize_columns)
             if only_unverified:
                 self.status_label.setText(f"Loaded {len(records)} unverified transactions.")
             else:
@@ -825,23 +826,29 @@ class TransactionReviewWindow(QtWidgets.QMainWindow):
         try:
             logger.info("Running recurring transaction clustering")
 
+            # Build the frame column-wise so pandas doesn't infer dtypes row by row.
+            # Plain lists let pandas fall back to object/NaN columns when a value is missing.
+            # Date stays as text; recurring_transactions() converts it with pd.to_datetime.
+            records = self.model._records
             df = pd.DataFrame(
-                [
-                    {
-                        "TransactionID": rec.transaction_id,
-                        "Date": rec.date,
-                        "Amount": rec.amount,
-                        "Description": rec.description,
-                    }
-                    for rec in self.model._records
-                ]
+                {
+                    "TransactionID": [rec.transaction_id for rec in records],
+                    "Date": [rec.date for rec in records],
+                    "Amount": [rec.amount for rec in records],
+                    "Description": [rec.description for rec in records],
+                }
             )
 
             kwargs = self._build_clustering_kwargs()
             clustered = recurring_transactions(df, **kwargs)
 
             # Map TransactionID -> Cluster
-            cluster_map = {int(row["TransactionID"]): int(row["Cluster"]) for _, row in clustered.iterrows()}
+            cluster_map = dict(
+                zip(
+                    clustered["TransactionID"].to_numpy(dtype=np.int64).tolist(),
+                    clustered["Cluster"].to_numpy(dtype=np.int64).tolist(),
+                )
+            )
 
             # Update records in place
             for rec in self.model._records:
@@ -854,7 +861,7 @@ class TransactionReviewWindow(QtWidgets.QMainWindow):
                 bottom_right = self.model.index(row_count - 1, TransactionTableModel.COL_CLUSTER)
                 self.model.dataChanged.emit(top_left, bottom_right, [QtCore.Qt.DisplayRole])
 
-            self._resize_columns()
+            QtCore.QTimer.singleShot(0, self._resize_columns)
 
             num_clusters = len({c for c in cluster_map.values() if c != -1})
             num_rows = len(cluster_map)
@@ -1,6 +1,5 @@
 import re
 from datetime import datetime
-from statistics import median
 
 from loguru import logger
 from pdfplumber.page import Page
@@ -8,7 +7,6 @@ from parsetrail.core.interfaces import IParser
 from parsetrail.core.utils import (
     PDFReader,
     convert_amount_to_float,
-    find_param_in_line,
     get_absolute_date,
 )
 from parsetrail.core.validation import Account, Statement, Transaction
@@ -17,7 +15,7 @@ from parsetrail.core.validation import Account, Statement, Transaction
 class Parser(IParser):
     # Plugin metadata required by IParser
     PLUGIN_NAME = "pdf_citicc_202506"
-    VERSION = "0.1.1"
+    VERSION = "0.1.2"
     SUFFIX = ".pdf"
     COMPANY = "Citibank"
     STATEMENT_TYPE = "Credit Account Monthly Statement"
@@ -32,7 +30,6 @@ class Parser(IParser):
     # Parsing constants
     HEADER_DATE = r"%m/%d/%y"
     LEADING_DATE = re.compile(r"^\d{2}/\d{2}\s")
-    TRANSACTION_DATE = re.compile(r"\d{2}/\d{2}")
     AMOUNT = re.compile(r"-?\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?")
     HEADER_COLS = [
         "Trans.",
@@ -40,6 +37,12 @@ class Parser(IParser):
         "Description",
         "Amount",
     ]
+    MAX_DESC_LINES = 4
+    # Every suffix of each header column that is long enough to count as a partial match
+    HEADER_SUFFIXES = {col: frozenset(col[i:] for i in range(len(col) - 2)) for col in HEADER_COLS}
+    HEADER_FRAGMENTS = frozenset().union(*HEADER_SUFFIXES.values())
+
+    __slots__ = ("reader", "chars", "start_date", "end_date", "start_balance", "end_balance")
 
     def parse(self, reader: PDFReader) -> Statement:
         """Entry point
@@ -52,12 +55,11 @@ class Parser(IParser):
         """
         logger.trace(f"Parsing {self.STATEMENT_TYPE} statement")
         try:
-            lines = reader.extract_lines_clean()
-            if not lines:
-                raise ValueError("No lines extracted from the PDF.")
             self.reader = reader
             # Extract raw chars from first page
-            self.chars = "".join([c["text"] for c in self.reader.PDF.pages[0].chars])
+            self.chars = "".join(c["text"] for c in self.reader.PDF.pages[0].chars)
+            if not self.chars:
+                raise ValueError("No text extracted from the first page of the PDF.")
             return self.extract_statement()
         except Exception as e:
             logger.error(f"Error parsing {self.STATEMENT_TYPE} statement: {e}")
@@ -167,9 +169,18 @@ class Parser(IParser):
         patterns = ["Previous balance ", "New balance "]
         balances = []
 
-        for pattern in patterns:
+        # The balances are in the account summary on the first page, so avoid
+        # layout-extracting the whole document unless they aren't found there.
+        page_text = self.reader.PDF.pages[0].extract_text(layout=True) or ""
+        page_lines = [" ".join(line.split()) for line in page_text.splitlines() if line.strip()]
+        balance_lines = self.find_lines_containing(page_lines, patterns)
+        if None in balance_lines.values():
+            balance_lines = self.find_lines_containing(self.reader.extract_lines_clean(), patterns)
+
+        for pattern, balance_line in balance_lines.items():
             try:
-                _, balance_line = find_param_in_line(self.reader.lines_clean, pattern)
+                if balance_line is None:
+                    raise ValueError(f"Parameter '{pattern}' not found in lines.")
                 balance_str = balance_line.split()[-1]
                 balance = -convert_amount_to_float(balance_str)
                 balances.append(balance)
@@ -181,12 +192,37 @@ class Parser(IParser):
 
         self.start_balance, self.end_balance = balances
 
+    @staticmethod
+    def find_lines_containing(lines: list[str], patterns: list[str]) -> dict[str, str | None]:
+        """Find the first line containing each pattern in a single pass.
+
+        Args:
+            lines (list[str]): Lines to search
+            patterns (list[str]): Substrings to search for
+
+        Returns:
+            dict[str, str | None]: First matching line for each pattern, or None if not found
+        """
+        found = dict.fromkeys(patterns)
+        remaining = len(patterns)
+        for line in lines:
+            for pattern in patterns:
+                if found[pattern] is None and pattern in line:
+                    found[pattern] = line
+                    remaining -= 1
+            if remaining == 0:
+                break
+        return found
+
     def get_transaction_array(self) -> list[list[str]]:
         """Extract lines containing transaction information.
 
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this statement
         """
+        # Pages are extracted sequentially on purpose. Every page reads from the same
+        # pdfminer document stream, which is not thread safe, and pdfminer is pure
+        # Python, so a thread pool would serialize on the GIL anyway.
         transaction_array = []
         for i, page in enumerate(self.reader.PDF.pages):
             try:
@@ -204,26 +240,33 @@ class Parser(IParser):
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this page
         """
+        # Skip pages whose raw text contains none of the header columns before paying for word extraction
+        page_text = "".join(c["text"] for c in page.chars)
+        if not any(col in page_text for col in self.HEADER_COLS):
+            logger.debug(f"Skipping page {page.page_number} because it has no table header text.")
+            return []
+
         # Get the metadata and text of every word in the header.
         page_words_all = page.extract_words()
 
+        # Collect every word that could be a header column or a fragment of one in a single pass.
+        # Words are unpacked once into (text, x0, x1, top, bottom) tuples.
+        candidates = {}
+        for word in page_words_all:
+            text = word["text"]
+            if text in self.HEADER_FRAGMENTS:
+                candidates.setdefault(text, []).append((text, word["x0"], word["x1"], word["top"], word["bottom"]))
+
         # Dynamically correct partial matches for columns
-        word_list = [word.get("text") for word in page_words_all]
-        word_set = set(word_list)
         header_cols = []
         for col in self.HEADER_COLS:
-            if col in word_set:
+            if col in candidates:
                 # Use the col word as is
                 header_cols.append(col)
             else:
                 # Attempt to find the largest partial match
-                matches = [word for word in word_set if col.endswith(word) and len(word) >= 3]
-                if matches:
-                    best_match = sorted(
-                        matches,
-                        key=lambda x: len(x),
-                        reverse=True,
-                    )[0]
+                best_match = max(self.HEADER_SUFFIXES[col] & candidates.keys(), key=len, default=None)
+                if best_match:
                     logger.debug(f"Matching fragment '{best_match}' to missing header '{col}'")
                     header_cols.append(best_match)
                 else:
@@ -231,62 +274,51 @@ class Parser(IParser):
                     header_cols.append(col)
 
         # Return empty if not all header names were found, even after partial match detection
-        missing_words = [word for word in header_cols if word not in word_set]
+        missing_words = [word for word in header_cols if word not in candidates]
         if missing_words:
             logger.debug(f"Skipping page {page.page_number} because a table header was not found.")
             return []
 
         # Get all the word objects that match the corrected header_cols
-        page_words = [word for word in page_words_all if word.get("text") in header_cols]
+        page_words = [word for text in dict.fromkeys(header_cols) for word in candidates[text]]
 
         # Filter out spurious words by removing anything > 10 points from the mode
-        y_mode = median(word.get("bottom") for word in page_words)
-        page_words = [word for word in page_words if abs(word.get("bottom") - y_mode) < 10]
+        bottoms = sorted(word[4] for word in page_words)
+        y_mode = bottoms[len(bottoms) // 2]
+        page_words = [word for word in page_words if abs(word[4] - y_mode) < 10]
 
         # Make sure there are the right number of matches, or return empty
         if len(page_words) != len(self.HEADER_COLS):
-            word_list = [word.get("text") for word in page_words]
+            word_list = [word[0] for word in page_words]
             logger.debug(f"Header keywords could not be matched. Expected: {self.HEADER_COLS}\nGot: {word_list}")
             return []
 
-        # Remap words list[dict] so it's addressable by column name
-        header = {}
-        for word in page_words:
-            header[word.get("text")] = {
-                "x0": word.get("x0"),
-                "x1": word.get("x1"),
-                "top": word.get("top"),
-                "bottom": word.get("bottom"),
-            }
+        # Remap words so they're addressable by column name
+        header = {word[0]: word for word in page_words}
+
+        # Header coordinates in header_cols order, each (text, x0, x1, top, bottom)
+        h0, h1, h2, h3 = (header[col] for col in header_cols)
 
         # Crop the page to the table size: [x0, top, x1, bottom]
         crop_page = page.crop(
             [
-                header[header_cols[0]]["x0"] - 3,  # Date col
-                header[header_cols[-1]]["bottom"] + 0.1,  # Amount col
-                header[header_cols[-1]]["x1"] + 2,  # Amount col
+                h0[1] - 3,  # Date col
+                h3[4] + 0.1,  # Amount col
+                h3[2] + 2,  # Amount col
                 page.height,
             ]
         )
 
-        def calculate_vertical_lines(header):
-            """
-            Create a list of vertical table separators based on the header coordinates
-            0: Trans. Date:     L justified
-            1: Post Date:       L Justified
-            2: Description:     L Justified
-            4: Amount:          R Justified
-            """
-            return [
-                header[header_cols[0]]["x0"] - 3,  # Trans. Date left
-                header[header_cols[1]]["x0"] - 2,  # Post Date left
-                header[header_cols[2]]["x0"] - 2,  # Description left
-                header[header_cols[3]]["x0"] - 20,  # Amount left
-                header[header_cols[3]]["x1"] + 2,  # Amount right
-            ]
+        # Vertical table separators based on the header coordinates
+        vertical_lines = (
+            h0[1] - 3,  # Trans. Date left, L justified
+            h1[1] - 2,  # Post Date left, L justified
+            h2[1] - 2,  # Description left, L justified
+            h3[1] - 20,  # Amount left, R justified
+            h3[2] + 2,  # Amount right
+        )
 
         # Extract the table from the cropped page using dynamic vertical separators
-        vertical_lines = calculate_vertical_lines(header)
         table_settings = {
             "vertical_strategy": "explicit",
             "horizontal_strategy": "lines",
@@ -307,8 +339,8 @@ class Parser(IParser):
 
             # Include only rows that have a date or empty in date col.
             # Break early if two rows are missing a date.
-            valid0 = bool(self.TRANSACTION_DATE.match(row[0])) or not row[0]
-            valid1 = bool(self.TRANSACTION_DATE.match(row[1])) or not row[0]
+            valid0 = self._is_transdate(row[0]) or not row[0]
+            valid1 = self._is_transdate(row[1]) or not row[0]
             if valid0 and valid1:
                 array.append(row)
 
@@ -324,47 +356,28 @@ class Parser(IParser):
             list[tuple]: Unsorted transaction array
         """
 
-        # Define column indices
-        tdate_col, pdate_col, desc_col, amount_col = 0, 1, 2, 3
-
-        def get_full_description(i_row):
-            """Lookahead for multi-line transactions"""
-            desc = []
-            multilines = 0
-            while i_row + multilines < len(array):
-                if multilines > 0 and array[i_row + multilines][pdate_col]:
-                    break
-                desc.append(array[i_row + multilines][desc_col])
-                amount_str = array[i_row + multilines][amount_col]
-                if self.AMOUNT.match(amount_str):
-                    return multilines, " ".join(desc), amount_str
-                if multilines > 3:
-                    break
-                multilines += 1
-            return multilines, None, None
-
         transactions = []
+        n_rows = len(array)
         i_row = 0
-        while i_row < len(array):
-            row = array[i_row]
+        while i_row < n_rows:
+            # Unpack the row cells once: trans. date, post date, description, amount
+            tdate, pdate, _, _ = array[i_row]
 
             # Return early if this is not a transaction start line
-            valid = bool(self.TRANSACTION_DATE.search(row[tdate_col])) or bool(
-                self.TRANSACTION_DATE.search(row[pdate_col])
-            )
+            valid = self._is_transdate(tdate) or self._is_transdate(pdate)
             if not valid:
                 i_row += 1
                 continue
 
             # Extract main part of the transaction
-            if row[tdate_col] and not row[pdate_col]:
-                row[pdate_col] = row[tdate_col]
-            if row[pdate_col] and not row[tdate_col]:
-                row[tdate_col] = row[pdate_col]
-            transaction_date = get_absolute_date(row[tdate_col], self.start_date, self.end_date)
-            posting_date = get_absolute_date(row[pdate_col], self.start_date, self.end_date)
-
-            multilines, desc, amount_str = get_full_description(i_row)
+            if tdate and not pdate:
+                pdate = tdate
+            if pdate and not tdate:
+                tdate = pdate
+            transaction_date = get_absolute_date(tdate, self.start_date, self.end_date)
+            posting_date = get_absolute_date(pdate, self.start_date, self.end_date)
+
+            multilines, desc, amount_str = self.get_full_description(array, i_row)
             i_row += multilines
             if amount_str is None:
                 continue
@@ -384,3 +397,33 @@ class Parser(IParser):
             i_row += 1
 
         return transactions
+
+    def get_full_description(self, array: list[list[str]], i_row: int) -> tuple[int, str | None, str | None]:
+        """Lookahead for multi-line transactions
+
+        Args:
+            array (list[list[str]]): Array containing valid transaction data
+            i_row (int): Index of the transaction start row
+
+        Returns:
+            tuple[int, str | None, str | None]: Extra lines consumed, full description, amount string
+        """
+        desc = []
+        n_rows = len(array)
+        multilines = 0
+        while i_row + multilines < n_rows:
+            _, pdate, desc_cell, amount_cell = array[i_row + multilines]
+            if multilines > 0 and pdate:
+                break
+            desc.append(desc_cell)
+            if amount_cell[:1] in ("-", "$") and self.AMOUNT.match(amount_cell):
+                return multilines, " ".join(desc), amount_cell
+            if multilines > self.MAX_DESC_LINES - 1:
+                break
+            multilines += 1
+        return multilines, None, None
+
+    @staticmethod
+    def _is_transdate(s: str) -> bool:
+        """Cheap check for a leading MM/DD date without invoking the regex engine"""
+        return len(s) >= 5 and s[2] == "/" and s[:2].isdecimal() and s[3:5].isdecimal()
@@ -1,6 +1,5 @@
 import re
 from datetime import datetime
-from statistics import mode
 
 from loguru import logger
 from pdfplumber.page import Page
@@ -8,8 +7,6 @@ from parsetrail.core.interfaces import IParser
 from parsetrail.core.utils import (
     PDFReader,
     convert_amount_to_float,
-    find_line_startswith,
-    find_param_in_line,
     find_regex_in_line,
     get_absolute_date,
 )
@@ -19,7 +16,7 @@ from parsetrail.core.validation import Account, Statement, Transaction
 class Parser(IParser):
     # Plugin metadata required by IParser
     PLUGIN_NAME = "pdf_lendingclublus_202506"
-    VERSION = "0.1.0"
+    VERSION = "0.1.1"
     SUFFIX = ".pdf"
     COMPANY = "LendingClub"
     STATEMENT_TYPE = "LevelUp Savings Monthly Statement"
@@ -33,8 +30,12 @@ class Parser(IParser):
     # Parsing constants
     HEADER_DATE = r"%m/%d/%Y"
     LEADING_DATE = re.compile(r"^\d{2}/\d{2}\s")
-    TRANSACTION_DATE = re.compile(r"\d{2}/\d{2}")
     AMOUNT = re.compile(r"-?\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?")
+    BALANCE_SUMMARY_HEADER = re.compile(r"Balance.*Deposits.*Paid.*Withdrawals.*Charge.*Balance")
+    START_DATE_LABEL = "Statement Begin Date:"
+    END_DATE_LABEL = "Statement End Date:"
+    ACCOUNT_NUMBER_LABEL = "Account Number:"
+    DATE_LABELS = (START_DATE_LABEL, END_DATE_LABEL)
     HEADER_COLS = [
         "Date",
         "Description",
@@ -44,6 +45,13 @@ class Parser(IParser):
         "(+)",
         "Balance",
     ]
+    # Every suffix of each header column that is long enough to count as a partial match
+    HEADER_SUFFIXES = {col: frozenset(col[i:] for i in range(len(col) - 2)) for col in HEADER_COLS}
+    HEADER_FRAGMENTS = frozenset().union(*HEADER_SUFFIXES.values())
+
+    def __init__(self):
+        # Resolved header_cols keyed by the set of candidate header words found on a page
+        self.header_cache: dict[frozenset[str], list[str]] = {}
 
     def parse(self, reader: PDFReader) -> Statement:
         """Entry point
@@ -61,12 +69,38 @@ class Parser(IParser):
             if not lines:
                 raise ValueError("No lines extracted from the PDF.")
             self.reader = reader
-            self.reader.lines_layout = self.reader.PDF.pages[0].extract_text(layout=True, x_density=3.45)
+            self.index_lines()
             return self.extract_statement()
         except Exception as e:
             logger.error(f"Error parsing {self.STATEMENT_TYPE} statement: {e}")
             raise
 
+    def index_lines(self) -> None:
+        """Find the first line holding each labelled statement field in a single pass over lines_clean.
+
+        Date labels must start the line, while the account number label may appear anywhere in it.
+        """
+        self.line_index: dict[str, str] = {}
+        for line in self.reader.lines_clean:
+            if line.startswith(self.DATE_LABELS):
+                label = self.START_DATE_LABEL if line.startswith(self.START_DATE_LABEL) else self.END_DATE_LABEL
+                self.line_index.setdefault(label, line)
+            if self.ACCOUNT_NUMBER_LABEL not in self.line_index and self.ACCOUNT_NUMBER_LABEL in line:
+                self.line_index[self.ACCOUNT_NUMBER_LABEL] = line
+            if len(self.line_index) == 3:
+                break
+
+    def get_indexed_line(self, label: str) -> str:
+        """Return the line found for label by index_lines().
+
+        Raises:
+            ValueError: If no line contains the label
+        """
+        line = self.line_index.get(label)
+        if line is None:
+            raise ValueError(f"Search string '{label}' not found in lines.")
+        return line
+
     def extract_statement(self) -> Statement:
         """Extracts all statement data
 
@@ -94,8 +128,8 @@ class Parser(IParser):
         logger.trace("Attempting to parse dates from text.")
         try:
             dates = []
-            for pattern in ["Statement Begin Date:", "Statement End Date:"]:
-                _, dateline = find_line_startswith(self.reader.lines_clean, pattern)
+            for label in self.DATE_LABELS:
+                dateline = self.get_indexed_line(label)
                 date_str = dateline.split(":")[1].split()[0]
                 dates.append(datetime.strptime(date_str, self.HEADER_DATE))
             self.start_date, self.end_date = dates
@@ -159,9 +193,8 @@ class Parser(IParser):
         Returns:
             str: Account number
         """
-        search_str = "Account Number:"
-        _, line = find_param_in_line(self.reader.lines_clean, search_str)
-        account_num = line.split(search_str)[-1].split()[0].strip()
+        line = self.get_indexed_line(self.ACCOUNT_NUMBER_LABEL)
+        account_num = line.split(self.ACCOUNT_NUMBER_LABEL)[-1].split()[0].strip()
         return account_num
 
     def get_statement_balances(self) -> None:
@@ -170,10 +203,7 @@ class Parser(IParser):
         Raises:
             ValueError: Unable to extract balances
         """
-        index, _, _ = find_regex_in_line(
-            self.reader.lines_clean,
-            r"Balance.*Deposits.*Paid.*Withdrawals.*Charge.*Balance",
-        )
+        index, _, _ = find_regex_in_line(self.reader.lines_clean, self.BALANCE_SUMMARY_HEADER)
         amount_strs = self.reader.lines_clean[index + 1].split()
         self.start_balance = convert_amount_to_float(amount_strs[0])
         self.end_balance = convert_amount_to_float(amount_strs[-1])
@@ -184,6 +214,8 @@ class Parser(IParser):
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this statement
         """
+        # Keep this loop sequential: pages share one pdfminer parser, which can't be read from
+        # several threads at once, and its pure-Python layout work holds the GIL throughout.
         transaction_array = []
         for i, page in enumerate(self.reader.PDF.pages):
             try:
@@ -202,31 +234,25 @@ class Parser(IParser):
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this page
         """
+        # Every accepted header word ends with the last three letters of its column, so skip
+        # pages whose raw text contains none of them before paying for word extraction
+        page_text = "".join(c["text"] for c in page.chars)
+        if not any(col[-3:] in page_text for col in self.HEADER_COLS):
+            logger.debug(f"Skipping page {page.page_number} because it has no table header text.")
+            return []
+
         # Get the metadata and text of every word in the header.
         page_words_all = page.extract_words()
 
-        # Dynamically correct partial matches for columns
-        word_list = [word.get("text") for word in page_words_all]
-        word_set = set(word_list)
-        header_cols = []
-        for col in self.HEADER_COLS:
-            if col in word_set:
-                # Use the col word as is
-                header_cols.append(col)
-            else:
-                # Attempt to find the largest partial match
-                matches = [word for word in word_set if col.endswith(word) and len(word) >= 3]
-                if matches:
-                    best_match = sorted(
-                        matches,
-                        key=lambda x: len(x),
-                        reverse=True,
-                    )[0]
-                    logger.debug(f"Matching fragment '{best_match}' to missing header '{col}'")
-                    header_cols.append(best_match)
-                else:
-                    # Use the original word
-                    header_cols.append(col)
+        # Keep only the words that could be a header column or a fragment of one
+        header_words = [word for word in page_words_all if word["text"] in self.HEADER_FRAGMENTS]
+        word_set = {word["text"] for word in header_words}
+
+        # Dynamically correct partial matches for columns, reusing the result from earlier pages
+        key = frozenset(word_set)
+        header_cols = self.header_cache.get(key)
+        if header_cols is None:
+            header_cols = self.header_cache[key] = self.resolve_header_cols(word_set)
 
         # Return empty if not all header names were found, even after partial match detection
         missing_words = [word for word in header_cols if word not in word_set]
@@ -235,11 +261,15 @@ class Parser(IParser):
             return []
 
         # Get all the word objects that match the corrected header_cols
-        page_words = [word for word in page_words_all if word.get("text") in header_cols]
+        header_col_set = frozenset(header_cols)
+        page_words = [word for word in header_words if word["text"] in header_col_set]
 
         # Filter out spurious words by removing anything > 2 points from the mode
-        y_mode = mode(word.get("bottom") for word in page_words)
-        page_words = [word for word in page_words if abs(word.get("bottom") - y_mode) < 2]
+        bottom_counts: dict[float, int] = {}
+        for word in page_words:
+            bottom_counts[word["bottom"]] = bottom_counts.get(word["bottom"], 0) + 1
+        y_mode = max(bottom_counts, key=bottom_counts.get)
+        page_words = [word for word in page_words if abs(word["bottom"] - y_mode) < 2]
 
         # Make sure there are the right number of matches, or return empty
         if len(page_words) != len(self.HEADER_COLS):
@@ -247,71 +277,85 @@ class Parser(IParser):
             logger.debug(f"Header keywords could not be matched. Expected: {self.HEADER_COLS}\nGot: {word_list}")
             return []
 
-        # Remap words list[dict] so it's addressable by column name
-        header = {}
-        for word in page_words:
-            header[word.get("text")] = {
-                "x0": word.get("x0"),
-                "x1": word.get("x1"),
-                "top": word.get("top"),
-                "bottom": word.get("bottom"),
-            }
-
-        # Crop the page to the table size: [x0, top, x1, bottom]
-        crop_page = page.crop(
-            [
-                header[header_cols[0]]["x0"] - 3,  # Date col
-                header[header_cols[0]]["bottom"] + 0.1,  # Date col
-                header[header_cols[-1]]["x1"] + 2,  # Balance col
-                page.height,
-            ]
+        # Order the header word coordinates (x0, x1, top, bottom) to match header_cols
+        coords = {word["text"]: (word["x0"], word["x1"], word["top"], word["bottom"]) for word in page_words}
+        header = [coords[col] for col in header_cols]
+
+        # Table size to crop the page to: [x0, top, x1, bottom]
+        bbox = (
+            header[0][0] - 3,  # Date col
+            header[0][3] + 0.1,  # Date col
+            header[-1][1] + 2,  # Balance col
+            page.height,
         )
 
-        def calculate_vertical_lines(header):
-            """
-            Create a list of vertical table separators based on the header coordinates
-            0: Date:                        R justified
-            1: Description:                 L Justified
-            2: Withdrawal / Debit (-):      R Justified
-            3: Deposit / Credit (-):        R Justified
-            4: Balance:                     R Justified
-            """
-            return [
-                header[header_cols[0]]["x0"] - 3,  # Date left
-                header[header_cols[1]]["x0"] - 2,  # Desc left
-                header[header_cols[2]]["x0"] - 3,  # Withdrawal left
-                header[header_cols[3]]["x1"] + 2,  # Debit (-) right
-                header[header_cols[5]]["x1"] + 2,  # Credit (+) right
-                header[header_cols[6]]["x1"] + 2,  # Balance right
-            ]
+        # Create a list of vertical table separators based on the header coordinates
+        # 0: Date:                        R justified
+        # 1: Description:                 L Justified
+        # 2: Withdrawal / Debit (-):      R Justified
+        # 3: Deposit / Credit (-):        R Justified
+        # 4: Balance:                     R Justified
+        vertical_lines = [
+            header[0][0] - 3,  # Date left
+            header[1][0] - 2,  # Desc left
+            header[2][0] - 3,  # Withdrawal left
+            header[3][1] + 2,  # Debit (-) right
+            header[5][1] + 2,  # Credit (+) right
+            header[6][1] + 2,  # Balance right
+        ]
 
         # Extract the table from the cropped page using dynamic vertical separators
-        vertical_lines = calculate_vertical_lines(header)
         table_settings = {
             "vertical_strategy": "explicit",
             "horizontal_strategy": "text",
             "explicit_vertical_lines": vertical_lines,
         }
-        raw_array = crop_page.extract_table(table_settings=table_settings)
+        raw_array = page.crop(bbox).extract_table(table_settings=table_settings)
 
         # Array validation
+        n_cols = len(vertical_lines) - 1
         array = []
         for i, row in enumerate(raw_array):
             # Make sure each row has the right number of columns
-            if len(row) != len(vertical_lines) - 1:
+            if len(row) != n_cols:
                 raise ValueError(f"Incorrect number of columns for row: {row}")
 
             # Include only rows that have a date in date col. Break early if two rows are missing a date.
-            if bool(self.TRANSACTION_DATE.match(row[0])):
+            if self._is_transdate(row[0]):
                 # Skip the fake balance forward transaction
                 if row[1] != "Balance Forward":
                     array.append(row)
             elif i > 0:
-                if not bool(self.TRANSACTION_DATE.match(raw_array[i - 1][0])):
+                if not self._is_transdate(raw_array[i - 1][0]):
                     break
 
         return array
 
+    def resolve_header_cols(self, word_set: set[str]) -> list[str]:
+        """Map each header column to the word on the page that represents it.
+
+        Args:
+            word_set (set[str]): Candidate header words found on the page
+
+        Returns:
+            list[str]: Header column names, or the largest partial match for any missing column
+        """
+        header_cols = []
+        for col in self.HEADER_COLS:
+            if col in word_set:
+                # Use the col word as is
+                header_cols.append(col)
+            else:
+                # Attempt to find the largest partial match
+                best_match = max(self.HEADER_SUFFIXES[col] & word_set, key=len, default=None)
+                if best_match:
+                    logger.debug(f"Matching fragment '{best_match}' to missing header '{col}'")
+                    header_cols.append(best_match)
+                else:
+                    # Use the original word
+                    header_cols.append(col)
+        return header_cols
+
     def parse_transaction_array(self, array: list[list[str]]) -> list[Transaction]:
         """Convert transaction table into structured data.
 
@@ -326,16 +370,16 @@ class Parser(IParser):
 
         def get_full_description(i_row):
             """Lookahead for multi-line transactions"""
-            desc = array[i_row][desc_col]
+            desc = [array[i_row][desc_col]]
             multilines = 1
             while (
                 i_row + multilines < len(array)
                 and not array[i_row + multilines][date_col]
                 and array[i_row + multilines][desc_col]
             ):
-                desc += f" {array[i_row + multilines][desc_col]}"
+                desc.append(array[i_row + multilines][desc_col])
                 multilines += 1
-            return desc, multilines - 1
+            return " ".join(desc), multilines - 1
 
         transactions = []
         i_row = 0
@@ -343,16 +387,14 @@ class Parser(IParser):
             row = array[i_row]
 
             # Return early if this is not a transaction start line
-            if not bool(self.TRANSACTION_DATE.search(row[date_col])):
+            if not self._is_transdate(row[date_col]):
                 i_row += 1
                 continue
 
             # Extract main part of the transaction
             posting_date = get_absolute_date(row[date_col], self.start_date, self.end_date)
-            additions = convert_amount_to_float(row[cred_col]) if row[cred_col] else 0.0
-            subtractions = convert_amount_to_float(row[debit_col]) if row[debit_col] else 0.0
-            amount = additions + subtractions
-            balance = convert_amount_to_float(row[bal_col]) if row[bal_col] else None
+            amount = self._to_amount(row[cred_col]) + self._to_amount(row[debit_col])
+            balance = self._to_amount(row[bal_col]) if row[bal_col] else None
             desc, multilines = get_full_description(i_row)
             i_row += multilines
 
@@ -373,3 +415,22 @@ class Parser(IParser):
             i_row += 1
 
         return transactions
+
+    @staticmethod
+    def _is_transdate(s: str) -> bool:
+        """Cheap check for a leading MM/DD date without invoking the regex engine"""
+        return len(s) >= 5 and s[2] == "/" and s[:2].isdecimal() and s[3:5].isdecimal()
+
+    @staticmethod
+    def _to_amount(s: str) -> float:
+        """Convert an amount cell to float, treating an empty cell as zero.
+
+        Plain amounts like -$1,234.56 are converted directly; anything else
+        falls back to convert_amount_to_float.
+        """
+        if not s:
+            return 0.0
+        try:
+            return float(s.replace(",", "").replace("$", ""))
+        except ValueError:
+            return convert_amount_to_float(s)
@@ -1,6 +1,5 @@
 import re
 from datetime import datetime
-from statistics import median
 
 from loguru import logger
 from pdfplumber.page import Page
@@ -8,7 +7,6 @@ from parsetrail.core.interfaces import IParser
 from parsetrail.core.utils import (
     PDFReader,
     convert_amount_to_float,
-    find_param_in_line,
     find_regex_in_line,
     get_absolute_date,
 )
@@ -18,7 +16,7 @@ from parsetrail.core.validation import Account, Statement, Transaction
 class Parser(IParser):
     # Plugin metadata required by IParser
     PLUGIN_NAME = "pdf_synchrony-amzncc_202501.py"
-    VERSION = "0.1.0"
+    VERSION = "0.1.1"
     SUFFIX = ".pdf"
     COMPANY = "Synchrony"
     STATEMENT_TYPE = "Amazon Store Card by Synchrony Bank"
@@ -32,17 +30,26 @@ class Parser(IParser):
     # Parsing constants
     HEADER_DATE = r"%m/%d/%Y"
     LEADING_DATE = re.compile(r"^\d{2}/\d{2}\s")
-    TRANSACTION_DATE = re.compile(r"\d{2}/\d{2}")
     AMOUNT = re.compile(r"-?\$\d{1,3}(?:,\d{3})*(?:\.\d{2})?")
+    PREVIOUS_BALANCE_DATE = re.compile(r"previous balance as of (\d{2}/\d{2}/\d{4})", re.IGNORECASE)
+    NEW_BALANCE_DATE = re.compile(r"new balance as of (\d{2}/\d{2}/\d{4})", re.IGNORECASE)
+    ACCOUNT_NUMBER = re.compile(r"account number ending in (\d{4})", re.IGNORECASE)
     HEADER_COLS = [
         "Date",
         "Reference",
         "Description",
         "Amount",
     ]
+    # Every suffix of each header column that is long enough to count as a partial match
+    HEADER_SUFFIXES = {col: frozenset(col[i:] for i in range(len(col) - 2)) for col in HEADER_COLS}
+    HEADER_FRAGMENTS = frozenset().union(*HEADER_SUFFIXES.values())
     HEADER_WORD_Y_TOLERANCE = 10
     MULTILINE_DESC_LIMIT = 3
 
+    def __init__(self):
+        # Resolved header_cols keyed by the set of candidate header words found on a page
+        self.header_cache: dict[frozenset[str], list[str]] = {}
+
     def parse(self, reader: PDFReader) -> Statement:
         """Entry point
 
@@ -55,12 +62,9 @@ class Parser(IParser):
         logger.trace(f"Parsing {self.STATEMENT_TYPE} statement")
         try:
             self.lines = reader.extract_lines_clean()
-            self.lower = [line.lower() for line in self.lines]
             if not self.lines:
                 raise ValueError("No lines extracted from the PDF.")
             self.reader = reader
-            # Extract raw chars from first page
-            self.chars = "".join([c["text"] for c in self.reader.PDF.pages[0].chars])
             return self.extract_statement()
         except Exception as e:
             logger.error(f"Error parsing {self.STATEMENT_TYPE} statement: {e}")
@@ -91,14 +95,11 @@ class Parser(IParser):
             ValueError: If dates cannot be parsed or are invalid.
         """
         logger.trace("Attempting to parse dates from text.")
-        patterns = (
-            re.compile(r"previous balance as of (\d{2}/\d{2}/\d{4})"),
-            re.compile(r"new balance as of (\d{2}/\d{2}/\d{4})"),
-        )
+        patterns = (self.PREVIOUS_BALANCE_DATE, self.NEW_BALANCE_DATE)
         dates = []
         try:
             for pattern in patterns:
-                _, _, match = find_regex_in_line(self.lower, pattern)
+                _, _, match = find_regex_in_line(self.lines, pattern)
                 dates.append(datetime.strptime(match.group(1), self.HEADER_DATE))
             self.start_date, self.end_date = dates
         except Exception as e:
@@ -161,8 +162,7 @@ class Parser(IParser):
         Returns:
             str: Account number
         """
-        pattern = re.compile(r"account number ending in (\d{4})")
-        _, _, match = find_regex_in_line(self.lower, pattern)
+        _, _, match = find_regex_in_line(self.lines, self.ACCOUNT_NUMBER)
         account_num = match.group(1)
         return account_num
 
@@ -172,12 +172,24 @@ class Parser(IParser):
         Raises:
             ValueError: Unable to extract balances
         """
-        patterns = ["previous balance as of ", "new balance as of "]
-        balances = []
+        patterns = ("previous balance as of ", "new balance as of ")
 
+        # Find the first line containing each pattern in a single pass
+        balance_lines = {}
+        for line in self.lines:
+            lower = line.lower()
+            for pattern in patterns:
+                if pattern not in balance_lines and pattern in lower:
+                    balance_lines[pattern] = lower
+            if len(balance_lines) == len(patterns):
+                break
+
+        balances = []
         for pattern in patterns:
             try:
-                _, balance_line = find_param_in_line(self.lower, pattern)
+                balance_line = balance_lines.get(pattern)
+                if balance_line is None:
+                    raise ValueError(f"Search string '{pattern}' not found in lines.")
                 balance_line_right = balance_line.split(pattern)[-1]
                 amount_str = balance_line_right.split()[1]
                 balance = -convert_amount_to_float(amount_str)
@@ -196,6 +208,7 @@ class Parser(IParser):
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this statement
         """
+        # Not threaded: pdfplumber pages lazily parse from a shared document stream
         transaction_array = []
         for i, page in enumerate(self.reader.PDF.pages):
             try:
@@ -213,6 +226,13 @@ class Parser(IParser):
         Returns:
             list[list[str]]: Processed lines containing dates and amounts for this page
         """
+        # Every accepted header word ends with the last three letters of its column, so skip
+        # pages whose raw text contains none of them before paying for word extraction
+        page_text = "".join(c["text"] for c in page.chars)
+        if not any(col[-3:] in page_text for col in self.HEADER_COLS):
+            logger.debug(f"Skipping page {page.page_number} because it has no table header text.")
+            return []
+
         # Get the metadata and text of every word in the header.
         page_words_all = page.extract_words()
 
@@ -221,8 +241,9 @@ class Parser(IParser):
             return []
 
         # Filter out spurious words by removing anything > 10 points from the mode
-        y_mode = median(word.get("bottom") for word in page_words)
-        page_words = [word for word in page_words if abs(word.get("bottom") - y_mode) < self.HEADER_WORD_Y_TOLERANCE]
+        bottoms = sorted(word["bottom"] for word in page_words)
+        y_mode = bottoms[len(bottoms) // 2]
+        page_words = [word for word in page_words if abs(word["bottom"] - y_mode) < self.HEADER_WORD_Y_TOLERANCE]
 
         # Make sure there are the right number of matches, or return empty
         if len(page_words) != len(self.HEADER_COLS):
@@ -230,35 +251,24 @@ class Parser(IParser):
             logger.debug(f"Header keywords could not be matched. Expected: {self.HEADER_COLS}\nGot: {word_list}")
             return []
 
-        # Remap words list[dict] so it's addressable by column name
-        header = {
-            word.get("text"): {
-                "x0": word.get("x0"),
-                "x1": word.get("x1"),
-                "top": word.get("top"),
-                "bottom": word.get("bottom"),
-            }
-            for word in page_words
-        }
-
-        def calculate_vertical_lines(header):
-            """
-            Create a list of vertical table separators based on the header coordinates
-            0: Date:            L justified
-            1: Reference:       L Justified
-            2: Description:     L Justified
-            3: Amount:          R Justified
-            """
-            return [
-                header[header_cols[0]]["x0"] - 3,  # Date left
-                header[header_cols[1]]["x0"] - 8,  # Reference left
-                header[header_cols[2]]["x0"] - 8,  # Description left
-                header[header_cols[3]]["x0"] - 20,  # Amount left
-                header[header_cols[3]]["x1"] + 3,  # Amount right
-            ]
+        # Order the header word coordinates (x0, x1, top, bottom) to match header_cols
+        coords = {word["text"]: (word["x0"], word["x1"], word["top"], word["bottom"]) for word in page_words}
+        header = [coords[col] for col in header_cols]
+
+        # Create a list of vertical table separators based on the header coordinates
+        # 0: Date:            L justified
+        # 1: Reference:       L Justified
+        # 2: Description:     L Justified
+        # 3: Amount:          R Justified
+        vertical_lines = [
+            header[0][0] - 3,  # Date left
+            header[1][0] - 8,  # Reference left
+            header[2][0] - 8,  # Description left
+            header[3][0] - 20,  # Amount left
+            header[3][1] + 3,  # Amount right
+        ]
 
         # Extract the table from the cropped page using dynamic vertical separators
-        vertical_lines = calculate_vertical_lines(header)
         table_settings = {
             "vertical_strategy": "explicit",
             "horizontal_strategy": "text",
@@ -268,10 +278,11 @@ class Parser(IParser):
         raw_array = page.extract_table(table_settings=table_settings)
 
         # Array validation
+        n_cols = len(vertical_lines) - 1
         array = []
         for row in raw_array or []:
             # Make sure each row has the right number of columns
-            if len(row) != len(vertical_lines) - 1:
+            if len(row) != n_cols:
                 raise ValueError(f"Incorrect number of columns for row: {row}")
 
             # Skip empty rows
@@ -280,9 +291,8 @@ class Parser(IParser):
 
             # Include only rows that have a date or empty in date col.
             # And have either an amount or nothing in in amount col
-            valid0 = bool(self.TRANSACTION_DATE.match(row[0])) or not row[0]
-            valid1 = bool(self.AMOUNT.match(row[3])) or not row[3]
-            if valid0 and valid1:
+            date_cell, amount_cell = row[0], row[3]
+            if (not date_cell or self._is_transdate(date_cell)) and (not amount_cell or self._is_amount(amount_cell)):
                 array.append(row)
 
         return array
@@ -292,30 +302,39 @@ class Parser(IParser):
         page_words_all: list[dict],
         page_number: int,
     ) -> tuple[list[str], list[dict]]:
-        # Dynamically correct partial matches for columns
-        word_list = [word.get("text") for word in page_words_all]
-        word_set = set(word_list)
+        # Keep only the words that could be a header column or a fragment of one
+        header_words = [word for word in page_words_all if word["text"] in self.HEADER_FRAGMENTS]
+        word_set = {word["text"] for word in header_words}
+
+        # Dynamically correct partial matches for columns, reusing the result from earlier pages
+        key = frozenset(word_set)
+        header_cols = self.header_cache.get(key)
+        if header_cols is None:
+            header_cols = self.header_cache[key] = self._resolve_header_cols(word_set)
+
+        missing_words = [word for word in header_cols if word not in word_set]
+        if missing_words:
+            logger.debug(f"Skipping page {page_number} because a table header was not found.")
+            return [], []
+
+        header_col_set = frozenset(header_cols)
+        page_words = [word for word in header_words if word["text"] in header_col_set]
+        return header_cols, page_words
+
+    def _resolve_header_cols(self, word_set: set[str]) -> list[str]:
         header_cols = []
         for col in self.HEADER_COLS:
             if col in word_set:
                 header_cols.append(col)
                 continue
 
-            matches = [word for word in word_set if col.endswith(word) and len(word) >= 3]
-            if matches:
-                best_match = max(matches, key=len)
+            best_match = max(self.HEADER_SUFFIXES[col] & word_set, key=len, default=None)
+            if best_match:
                 logger.debug(f"Matching fragment '{best_match}' to missing header '{col}'")
                 header_cols.append(best_match)
             else:
                 header_cols.append(col)
-
-        missing_words = [word for word in header_cols if word not in word_set]
-        if missing_words:
-            logger.debug(f"Skipping page {page_number} because a table header was not found.")
-            return [], []
-
-        page_words = [word for word in page_words_all if word.get("text") in header_cols]
-        return header_cols, page_words
+        return header_cols
 
     def parse_transaction_array(self, array: list[list[str]]) -> list[Transaction]:
         """Convert transaction table into structured data.
@@ -339,7 +358,7 @@ class Parser(IParser):
                     break
                 desc.append(array[i_row + multilines][desc_col])
                 amount_str = array[i_row + multilines][amount_col]
-                if self.AMOUNT.match(amount_str):
+                if self._is_amount(amount_str):
                     return multilines, " ".join(desc), amount_str
                 if multilines > self.MULTILINE_DESC_LIMIT:
                     break
@@ -352,7 +371,7 @@ class Parser(IParser):
             row = array[i_row]
 
             # Return early if this is not a transaction start line
-            if not bool(self.TRANSACTION_DATE.search(row[date_col])):
+            if not self._is_transdate(row[date_col]):
                 i_row += 1
                 continue
 
@@ -388,3 +407,12 @@ class Parser(IParser):
             i_row += 1
 
         return transactions
+
+    @staticmethod
+    def _is_transdate(s: str) -> bool:
+        """Cheap check for a leading MM/DD date without invoking the regex engine"""
+        return len(s) >= 5 and s[2] == "/" and s[:2].isdecimal() and s[3:5].isdecimal()
+
+    def _is_amount(self, s: str) -> bool:
+        """Check for a dollar amount, skipping the regex unless the leading characters fit"""
+        return s.startswith(("$", "-$")) and self.AMOUNT.match(s) is not None
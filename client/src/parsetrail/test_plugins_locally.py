@@ -1,4 +1,5 @@
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from parsetrail.build_plugins import PLUGINS_DIR, compile_plugins
 from parsetrail.core.initialize import initialize_db
@@ -16,10 +17,14 @@ settings.plugin_dir = PLUGINS_DIR
 # Initialze db and plugin manager
 Session = initialize_db()
 plugin_manager = PluginManager()
-plugin_manager.load_plugins()
+
+# Load plugins in the background while Qt starts up on the main thread
+with ThreadPoolExecutor(max_workers=1) as executor:
+    plugins_loaded = executor.submit(plugin_manager.load_plugins)
+    app = QApplication(sys.argv)
+    plugins_loaded.result()
 
 # Start the application
-app = QApplication(sys.argv)
 window = ParseTestDialog(Session, plugin_manager)
 window.show()
 sys.exit(app.exec_())
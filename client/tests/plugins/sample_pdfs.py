@@ -0,0 +1,247 @@
+"""
+Synthetic sample statements for plugin regression tests.
+
+Each builder lays out the text a plugin looks for at fixed coordinates and returns the raw bytes
+of a small PDF written with the standard Helvetica font, so no real statements are committed.
+"""
+
+PAGE_WIDTH = 612
+PAGE_HEIGHT = 792
+FONT_SIZE = 9
+# Helvetica advance widths (1/1000 em) of the characters used in amounts, for right-aligned text
+AMOUNT_CHAR_WIDTHS = {**dict.fromkeys("0123456789$", 556), ",": 278, ".": 278, "-": 333, "C": 722, "R": 722}
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def build_pdf(pages: list[list[tuple]]) -> bytes:
+    """Write a minimal PDF.
+
+    Args:
+        pages (list[list[tuple]]): Items per page: ("text", x0, top, string), ("amount", x1, top, string)
+            for right-aligned amounts, or ("line", x0, x1, top). top is measured down from the top of the
+            page like pdfplumber.
+
+    Returns:
+        bytes: PDF file contents
+    """
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        None,  # Page tree, filled in once the page object numbers are known
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+    ]
+    page_refs = []
+    for items in pages:
+        ops = []
+        for item in items:
+            if item[0] in ("text", "amount"):
+                kind, x, top, text = item
+                if kind == "amount":
+                    x -= sum(AMOUNT_CHAR_WIDTHS[char] for char in text) * FONT_SIZE / 1000
+                y = PAGE_HEIGHT - top - FONT_SIZE
+                ops.append(f"BT /F1 {FONT_SIZE} Tf {x} {y} Td ({_escape(text)}) Tj ET")
+            else:
+                _, x0, x1, top = item
+                y = PAGE_HEIGHT - top
+                ops.append(f"0.5 w {x0} {y} m {x1} {y} l S")
+        stream = "".join(f"{op}\n" for op in ops).encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream")
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %d %d] /Resources << /Font << /F1 3 0 R >> >> "
+            b"/Contents %d 0 R >>" % (PAGE_WIDTH, PAGE_HEIGHT, content_ref)
+        )
+        page_refs.append(len(objects))
+    kids = " ".join(f"{ref} 0 R" for ref in page_refs).encode()
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, len(page_refs))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref_offset = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref_offset)
+    return bytes(out)
+
+
+def _ruled_rows(rows: list[tuple], cols: tuple, top: float, x0: float, x1: float) -> list[tuple]:
+    """Lay out table rows with a rule under each one, as on Citi statements.
+
+    cols holds a (kind, x) pair per column: ("text", left edge) or ("amount", right edge).
+    """
+    items = [("line", x0, x1, top)]
+    for i, row in enumerate(rows):
+        row_top = top + 4 + 15 * i
+        items += [(kind, x, row_top, cell) for (kind, x), cell in zip(cols, row) if cell]
+        items.append(("line", x0, x1, row_top + 12))
+    return items
+
+
+def _rows(rows: list[tuple], cols: tuple, top: float) -> list[tuple]:
+    """Lay out unruled table rows 14 points apart, with cols as in _ruled_rows()."""
+    return [(kind, x, top + 14 * i, cell) for i, row in enumerate(rows) for (kind, x), cell in zip(cols, row) if cell]
+
+
+def citicc_202506(summary_on_first_page: bool = True) -> bytes:
+    """Citi credit card statement with a two page transaction table and a trailing page without one.
+
+    With summary_on_first_page=False the account summary moves to the last page.
+    """
+    header = [
+        ("text", 50, 100, "Trans."),
+        ("text", 100, 100, "Post"),
+        ("text", 150, 100, "Description"),
+        ("text", 500, 100, "Amount"),
+    ]
+    cols = (("text", 50), ("text", 100), ("text", 150), ("amount", 531))
+    page1 = [
+        ("text", 50, 40, "www.citicards.com"),
+        ("text", 50, 60, "Account number ending in: 4321"),
+        ("text", 50, 75, "Billing Period: 05/10/25-06/09/25"),
+    ]
+    summary = [
+        ("text", 50, 120, "Account Summary"),
+        ("text", 50, 135, "Previous balance"),
+        ("amount", 340, 135, "$1,234.56"),
+        ("text", 50, 150, "Payments"),
+        ("amount", 340, 150, "-$500.00"),
+        ("text", 50, 165, "New balance"),
+        ("amount", 340, 165, "$2,351.85"),
+    ]
+    page2 = header + _ruled_rows(
+        [
+            ("05/12", "05/13", "COFFEE SHOP SEATTLE WA", "$4.50"),
+            ("05/14", "05/15", "AIRLINE TICKET", ""),
+            ("", "", "PASSENGER DOE/JANE", "$1234.56"),
+            ("", "05/20", "PAYMENT THANK YOU", "-$500.00"),
+            ("05/22", "05/22", "STORE REFUND", "$12.34CR"),
+            ("05/25", "05/26", "GROCERY OUTLET", "$1,045.10"),
+        ],
+        cols,
+        115,
+        45,
+        540,
+    )
+    page3 = header + _ruled_rows(
+        [
+            ("06/01", "06/02", "HARDWARE STORE", "$88.20"),
+            ("06/03", "06/03", "RETURNED ITEM", "$40.00-"),
+            ("06/05", "06/06", "GAS STATION", "$37.50"),
+        ],
+        cols,
+        115,
+        45,
+        540,
+    )
+    page4 = [
+        ("text", 50, 60, "Interest charge calculation"),
+        ("text", 50, 75, "Your Annual Percentage Rate (APR) is the annual interest rate on your account."),
+    ]
+    if summary_on_first_page:
+        page1 += summary
+    else:
+        page4 += summary
+    return build_pdf([page1, page2, page3, page4])
+
+
+def lendingclublus_202506() -> bytes:
+    """LendingClub savings statement with a doubled-glyph title and a transaction table over two pages."""
+    header = [
+        ("text", 50, 250, "Date"),
+        ("text", 110, 250, "Description"),
+        ("text", 330, 250, "Withdrawal"),
+        ("text", 378, 250, "(-)"),
+        ("text", 420, 250, "Deposit"),
+        ("text", 454, 250, "(+)"),
+        ("text", 500, 250, "Balance"),
+    ]
+    cols = (("text", 50), ("text", 110), ("amount", 387), ("amount", 465), ("amount", 532.5))
+    page1 = (
+        [
+            ("text", 50, 40, "LLeevveellUUpp SSaavviinnggss"),
+            ("text", 50, 60, "Account Number: 9876543210"),
+            ("text", 50, 75, "Statement Begin Date: 05/01/2025"),
+            ("text", 50, 90, "Statement End Date: 05/31/2025"),
+            ("text", 50, 120, "Beginning Balance"),
+            ("text", 140, 120, "Deposits/Credits"),
+            ("text", 230, 120, "Paid Interest"),
+            ("text", 300, 120, "Withdrawals/Debits"),
+            ("text", 400, 120, "Service Charge"),
+            ("text", 480, 120, "Ending Balance"),
+            ("text", 50, 135, "$5,000.00"),
+            ("text", 140, 135, "$1,450.00"),
+            ("text", 230, 135, "$4.11"),
+            ("text", 300, 135, "-$375.25"),
+            ("text", 400, 135, "$0.00"),
+            ("text", 480, 135, "$6,078.86"),
+        ]
+        + header
+        + _rows(
+            [
+                ("05/01", "Balance Forward", "", "", "$5,000.00"),
+                ("05/03", "Transfer from Checking", "", "$1,200.00", "$6,200.00"),
+                ("05/10", "ACH Withdrawal", "-$300.00", "", "$5,900.00"),
+                ("05/12", "Mobile Deposit", "", "$250.00", "$6,150.00"),
+            ],
+            cols,
+            265,
+        )
+        + [("text", 50, 340, "Continued on next page")]
+    )
+    page2 = (
+        header
+        + _rows(
+            [
+                ("05/20", "Card Purchase", "-$75.25", "", "$6,074.75"),
+                ("05/31", "Interest Paid", "", "$4.11", "$6,078.86"),
+            ],
+            cols,
+            265,
+        )
+        + [("text", 50, 320, "Total for this period"), ("text", 50, 334, "Ending balance on 05/31/2025")]
+    )
+    page3 = [
+        ("text", 50, 60, "Important information about your account"),
+        ("text", 50, 75, "In case of errors or questions about your electronic transfers, call us."),
+    ]
+    return build_pdf([page1, page2, page3])
+
+
+def synchrony_amzncc_202501() -> bytes:
+    """Amazon store card statement with a multi-line description and a page without a table."""
+    header = [
+        ("text", 50, 150, "Date"),
+        ("text", 100, 150, "Reference"),
+        ("text", 200, 150, "Description"),
+        ("text", 500, 150, "Amount"),
+    ]
+    cols = (("text", 50), ("text", 100), ("text", 200), ("amount", 531))
+    page1 = [
+        ("text", 50, 40, "amazon.syf.com"),
+        ("text", 50, 60, "Account Number ending in 5678"),
+        ("text", 50, 75, "Previous Balance as of 04/10/2025 $250.00"),
+        ("text", 50, 90, "New Balance as of 05/09/2025 $315.25"),
+    ]
+    page2 = header + _rows(
+        [
+            ("04/12", "P9281AB01", "AMAZON MARKETPLACE", "$45.99"),
+            ("04/15", "P9281AB02", "AMAZON.COM*AB12CD", "$120.00"),
+            ("04/20", "F3921CD03", "PAYMENT - THANK YOU", "-$100.00"),
+            ("05/02", "P9281AB04", "AMAZON DIGITAL SERVICES", ""),
+            ("", "", "KINDLE UNLIMITED", "$9.26"),
+            ("05/05", "P9281AB05", "AMAZON RETAIL", "$1,000.00"),
+        ],
+        cols,
+        165,
+    )
+    page3 = [
+        ("text", 50, 60, "Interest Charge Calculation"),
+        ("text", 50, 75, "Your Annual Percentage Rate (APR) is the annual interest rate on your account."),
+    ]
+    return build_pdf([page1, page2, page3])
@@ -0,0 +1,75 @@
+from datetime import datetime
+
+import pytest
+
+from parsetrail.core.utils import PDFReader
+from parsetrail.core.validation import Statement
+from parsetrail.plugins.pdf_citicc_202506 import Parser
+from tests.plugins import sample_pdfs
+
+
+def make_parser() -> Parser:
+    parser = Parser()
+    parser.start_date = datetime(2025, 5, 10)
+    parser.end_date = datetime(2025, 6, 9)
+    return parser
+
+
+@pytest.mark.parametrize(
+    "amount_cell, expected",
+    [
+        ("$12.34", -12.34),
+        ("-$12.34", 12.34),
+        ("$1,234.56", -1234.56),
+        ("$1234.56", -1234.56),
+        ("$12.34CR", 12.34),
+        ("$12.34-", 12.34),
+    ],
+)
+def test_parse_transaction_array_amount_formats(amount_cell: str, expected: float) -> None:
+    parser = make_parser()
+    array = [["05/12", "05/13", "COFFEE SHOP", amount_cell]]
+    transactions = parser.parse_transaction_array(array)
+    assert len(transactions) == 1
+    assert transactions[0].amount == pytest.approx(expected)
+    assert transactions[0].desc == "COFFEE SHOP"
+
+
+def test_parse_transaction_array_multiline_description() -> None:
+    parser = make_parser()
+    array = [
+        ["05/12", "05/13", "AIRLINE TICKET", ""],
+        ["", "", "PASSENGER: DOE/JANE", "$1234.56CR"],
+        ["05/20", "05/20", "GROCERY STORE", "$45.10"],
+    ]
+    transactions = parser.parse_transaction_array(array)
+    assert [t.desc for t in transactions] == ["AIRLINE TICKET PASSENGER: DOE/JANE", "GROCERY STORE"]
+    assert [t.amount for t in transactions] == pytest.approx([1234.56, -45.10])
+
+
+def test_parse_transaction_array_skips_rows_without_amount() -> None:
+    parser = make_parser()
+    array = [["05/12", "05/13", "PENDING", "n/a"]]
+    assert parser.parse_transaction_array(array) == []
+
+
+def parse_sample(data: bytes) -> Statement:
+    with PDFReader(data) as reader:
+        return Parser().parse(reader)
+
+
+# Expected values are the output of the plugin before its 0.1.2 rework on the same sample
+@pytest.mark.parametrize("summary_on_first_page", [True, False])
+def test_parse_sample_statement(summary_on_first_page: bool) -> None:
+    statement = parse_sample(sample_pdfs.citicc_202506(summary_on_first_page))
+    assert (statement.start_date, statement.end_date) == (datetime(2025, 5, 10), datetime(2025, 6, 9))
+    assert len(statement.accounts) == 1
+    account = statement.accounts[0]
+    assert account.account_num == "4321"
+    assert (account.start_balance, account.end_balance) == pytest.approx((-1234.56, -2351.85))
+    assert len(account.transactions) == 8
+    assert [t.amount for t in account.transactions] == pytest.approx(
+        [-4.50, -1234.56, 500.00, 12.34, -1045.10, -88.20, 40.00, -37.50]
+    )
+    assert account.transactions[1].desc == "AIRLINE TICKET PASSENGER DOE/JANE"
+    assert account.transactions[2].transaction_date == datetime(2025, 5, 20)
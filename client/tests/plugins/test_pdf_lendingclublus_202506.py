@@ -0,0 +1,27 @@
+from datetime import datetime
+
+import pytest
+
+from parsetrail.core.utils import PDFReader
+from parsetrail.core.validation import Statement
+from parsetrail.plugins.pdf_lendingclublus_202506 import Parser
+from tests.plugins import sample_pdfs
+
+
+def parse_sample(data: bytes) -> Statement:
+    with PDFReader(data) as reader:
+        return Parser().parse(reader)
+
+
+# Expected values are the output of the plugin before its line indexing and header matching rework
+def test_parse_sample_statement() -> None:
+    statement = parse_sample(sample_pdfs.lendingclublus_202506())
+    assert (statement.start_date, statement.end_date) == (datetime(2025, 5, 1), datetime(2025, 5, 31))
+    assert len(statement.accounts) == 1
+    account = statement.accounts[0]
+    assert account.account_num == "9876543210"
+    assert (account.start_balance, account.end_balance) == pytest.approx((5000.00, 6078.86))
+    assert len(account.transactions) == 5
+    assert [t.amount for t in account.transactions] == pytest.approx([1200.00, -300.00, 250.00, -75.25, 4.11])
+    assert [t.balance for t in account.transactions] == pytest.approx([6200.00, 5900.00, 6150.00, 6074.75, 6078.86])
+    assert "Balance Forward" not in [t.desc for t in account.transactions]
@@ -0,0 +1,28 @@
+import importlib
+from datetime import datetime
+
+import pytest
+
+from parsetrail.core.utils import PDFReader
+from parsetrail.core.validation import Statement
+from tests.plugins import sample_pdfs
+
+Parser = importlib.import_module("parsetrail.plugins.pdf_synchrony-amzncc_202501").Parser
+
+
+def parse_sample(data: bytes) -> Statement:
+    with PDFReader(data) as reader:
+        return Parser().parse(reader)
+
+
+# Expected values are the output of the plugin before its header matching rework
+def test_parse_sample_statement() -> None:
+    statement = parse_sample(sample_pdfs.synchrony_amzncc_202501())
+    assert (statement.start_date, statement.end_date) == (datetime(2025, 4, 10), datetime(2025, 5, 9))
+    assert len(statement.accounts) == 1
+    account = statement.accounts[0]
+    assert account.account_num == "5678"
+    assert (account.start_balance, account.end_balance) == pytest.approx((-250.00, -315.25))
+    assert len(account.transactions) == 5
+    assert [t.amount for t in account.transactions] == pytest.approx([-45.99, -120.00, 100.00, -9.26, -1000.00])
+    assert account.transactions[3].desc == "AMAZON DIGITAL SERVICES KINDLE UNLIMITED"
@@ -4,23 +4,69 @@ from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
 from orm import StatementUploads
 from ssh import fetch_encrypted_file, load_master_key
 
+_JSON_DECODER = json.JSONDecoder()
 
-def decrypt_statement(row: StatementUploads) -> tuple[bytes, dict]:
-    """AES-GCM decrypt the selected statement."""
-    master_key = load_master_key()
-    ciphertext = fetch_encrypted_file(row.file_name)
-    cipher = Cipher(
-        algorithms.AES(master_key), modes.GCM(row.init_vector, row.auth_tag)
-    )
+# Optional pycryptodome backend (AES-NI is picked up automatically); cryptography
+# stays the default.
+# Legacy pycrypto installs the same Crypto package but has no GCM mode.
+try:
+    from Crypto.Cipher import AES as _PycryptodomeAES
+except ImportError:
+    _PycryptodomeAES = None
+if not hasattr(_PycryptodomeAES, "MODE_GCM"):
+    _PycryptodomeAES = None
+
+
+def decrypt_ciphertext(
+    master_key: bytes,
+    init_vector: bytes,
+    auth_tag: bytes,
+    ciphertext: bytes,
+) -> bytes:
+    """AES-GCM decrypt raw ciphertext with its stored IV and auth tag.
+
+    Goes through pycryptodome when it is installed.
+    """
+    if _PycryptodomeAES is not None:
+        cipher = _PycryptodomeAES.new(
+            master_key, _PycryptodomeAES.MODE_GCM, init_vector
+        )
+        return cipher.decrypt_and_verify(ciphertext, auth_tag)
+
+    # The tag goes to the GCM mode rather than being appended to a copy of the
+    # ciphertext, and update() already returns the whole plaintext for GCM.
+    cipher = Cipher(algorithms.AES(master_key), modes.GCM(init_vector, auth_tag))
     decryptor = cipher.decryptor()
-    plaintext = decryptor.update(ciphertext) + decryptor.finalize()
-    metadata = {}
-    if row.metadata_field:
+    plaintext = decryptor.update(ciphertext)
+    decryptor.finalize()
+    return plaintext
+
+
+def parse_metadata(metadata_field: str | None) -> dict:
+    """Parse the upload metadata JSON, tolerating trailing junk or a truncated string."""
+    if not metadata_field:
+        return {}
+    raw = metadata_field.lstrip()
+    try:
+        # raw_decode stops at the end of the first JSON value instead of failing
+        metadata, _ = _JSON_DECODER.raw_decode(raw)
+    except ValueError:
         try:
-            metadata = json.loads(row.metadata_field)
-        except Exception:
-            try:
-                metadata = json.loads(row.metadata_field + '"}')
-            except Exception:
-                metadata = {}
-    return plaintext, metadata
+            metadata = json.loads(raw + '"}')
+        except ValueError:
+            return {}
+    return metadata if isinstance(metadata, dict) else {}
+
+
+def decrypt_statement(
+    row: StatementUploads,
+    ciphertext: bytes | None = None,
+) -> tuple[bytes, dict]:
+    """AES-GCM decrypt the selected statement, fetching it unless already provided."""
+    master_key = load_master_key()
+    if ciphertext is None:
+        ciphertext = fetch_encrypted_file(row.file_name)
+    plaintext = decrypt_ciphertext(
+        master_key, row.init_vector, row.auth_tag, ciphertext
+    )
+    return plaintext, parse_metadata(row.metadata_field)
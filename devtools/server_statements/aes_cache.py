@@ -0,0 +1,43 @@
+"""
+On-disk cache of decrypted statements for repeated batch runs.
+
+Entries are keyed by upload id and auth tag, so a re-uploaded statement (new tag)
+never hits a stale plaintext. Files hold decrypted financial data: the directory
+is private to the user and the cache is opt-in (see batch_plugin_tester).
+"""
+
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_DIR = Path.home() / ".cache" / "parsetrail" / "plaintext"
+
+
+def cache_path(row_id: int, auth_tag: bytes) -> Path:
+    return CACHE_DIR / f"{row_id}-{auth_tag.hex()}.bin"
+
+
+def read_cached(row_id: int, auth_tag: bytes) -> bytes | None:
+    """Return the cached plaintext, or None on a miss."""
+    try:
+        return cache_path(row_id, auth_tag).read_bytes()
+    except FileNotFoundError:
+        return None
+
+
+def store(row_id: int, auth_tag: bytes, plaintext: bytes) -> None:
+    """Write a plaintext entry atomically; racing writers of one entry are harmless."""
+    path = cache_path(row_id, auth_tag)
+    if path.exists():
+        return
+    CACHE_DIR.mkdir(mode=0o700, parents=True, exist_ok=True)
+    # mkstemp opens with O_CREAT | O_EXCL and mode 0600; the rename makes the entry
+    # appear complete or not at all
+    fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(plaintext)
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
@@ -6,14 +6,20 @@ and attempts to parse via the in-memory parse pipeline. Summarizes failures.
 """
 
 import argparse
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable, Iterator, Sequence
 
 from loguru import logger
+from sqlalchemy import select
 
-from aes import decrypt_statement
-from db import SessionLocal
+import aes_cache
 from orm import StatementUploads
+from parse_worker import init_worker, parse_statement
+from ssh import fetch_encrypted_file, load_master_key
 
 # Make the client modules importable
 import sys
@@ -24,55 +30,130 @@ if not CLIENT_SRC.exists():
 sys.path.insert(0, str(CLIENT_SRC))
 
 try:
+    from parsetrail.build_plugins import PLUGINS_DIR, source_signature  # noqa: E402
     from parsetrail.build_plugins import main as build_plugins  # noqa: E402
-    from parsetrail.core.parse import ParseInput, parse_any  # noqa: E402
-    from parsetrail.core.plugins import PluginManager  # noqa: E402
 except Exception as e:  # pragma: no cover - optional dependency
     logger.warning(f"Unable to import ParseTrail client modules: {e}")
     raise
 
+# Plugin sources and output directory as of the last build done by this tool
+BUILD_SIGNATURE_FILE = Path.home() / ".cache" / "parsetrail" / "plugin_build.json"
+
+
+def _ensure_plugins(force: bool = False) -> None:
+    """Recompile plugins when their sources changed since the last build."""
+    signature = {
+        "plugins_dir": str(PLUGINS_DIR),
+        "sources": [list(entry) for entry in source_signature()],
+    }
+    try:
+        last_signature = json.loads(BUILD_SIGNATURE_FILE.read_text())
+    except (FileNotFoundError, ValueError):
+        last_signature = None
+    if force or signature != last_signature or not any(PLUGINS_DIR.glob("*.pyc")):
+        build_plugins()
+        BUILD_SIGNATURE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        BUILD_SIGNATURE_FILE.write_text(json.dumps(signature))
+
 
 def _iter_ready_rows(
     ids: Sequence[int] | None = None, limit: int | None = None
 ) -> Iterable[StatementUploads]:
+    # Imported here rather than at module level: spawned pool workers re-import this
+    # module, and importing db eagerly connects (and may open an SSH tunnel).
+    from db import SessionLocal
+
+    stmt = select(StatementUploads).where(StatementUploads.plugin_status == "ready")
+    if ids:
+        stmt = stmt.where(StatementUploads.id.in_(ids))
+    if limit:
+        stmt = stmt.limit(limit)
+    stmt = stmt.order_by(StatementUploads.id.asc())
+
+    # Stream through a server-side cursor rather than buffering the whole result
     with SessionLocal() as session:
-        q = session.query(StatementUploads).filter(
-            StatementUploads.plugin_status == "ready"
-        )
-        if ids:
-            q = q.filter(StatementUploads.id.in_(ids))
-        if limit:
-            q = q.limit(limit)
-        for row in q.order_by(StatementUploads.id.asc()):
-            yield row
-
-
-def _parse_row(row: StatementUploads, plugin_manager: PluginManager):
-    plaintext, metadata = decrypt_statement(row)
-    fname = metadata.get("filename") or metadata.get("file_name") or row.file_name
-    suffix = Path(fname).suffix or ".bin"
-    parse_input = ParseInput(name=fname, suffix=suffix.lower(), data=plaintext)
-    statement = parse_any(SessionLocal, plugin_manager, parse_input, hard_fail=False)
-    return statement
-
-
-def run(ids: Sequence[int] | None = None, limit: int | None = None) -> int:
-    build_plugins()
-    plugin_manager = PluginManager()
-    plugin_manager.load_plugins()
+        yield from session.execute(stmt.execution_options(yield_per=50)).scalars()
+
+
+def _fetch_input(row: StatementUploads, use_cache: bool) -> tuple[bytes, bool]:
+    """Return (data, is_plaintext): the cached plaintext if allowed, else ciphertext."""
+    if use_cache:
+        plaintext = aes_cache.read_cached(row.id, row.auth_tag)
+        if plaintext is not None:
+            return plaintext, True
+    return fetch_encrypted_file(row.file_name), False
+
+
+def _prefetch_inputs(
+    rows: Iterable[StatementUploads], depth: int, use_cache: bool
+) -> Iterator[tuple[StatementUploads, Future]]:
+    """Keep up to `depth` fetches in flight ahead of the row being parsed."""
+    with ThreadPoolExecutor(max_workers=depth) as executor:
+        pending: deque[tuple[StatementUploads, Future]] = deque()
+        for row in rows:
+            pending.append((row, executor.submit(_fetch_input, row, use_cache)))
+            if len(pending) >= depth:
+                yield pending.popleft()
+        while pending:
+            yield pending.popleft()
+
+
+def run(
+    ids: Sequence[int] | None = None,
+    limit: int | None = None,
+    prefetch: int = 4,
+    workers: int | None = None,
+    rebuild_plugins: bool = False,
+    plaintext_cache: bool = False,
+) -> int:
+    # Reuse the compiled plugins only while their sources are unchanged
+    _ensure_plugins(force=rebuild_plugins)
+    master_key = load_master_key()
+    workers = max(workers or os.cpu_count() or 1, 1)
 
     failures: list[tuple[int, str]] = []
     total = 0
 
-    for row in _iter_ready_rows(ids, limit):
-        total += 1
-        try:
-            _parse_row(row, plugin_manager)
-            logger.success(f"Parsed id={row.id} file={row.file_name}")
-        except Exception as e:
-            err = str(e)
-            failures.append((row.id, err))
-            logger.error(f"Failed id={row.id} file={row.file_name}: {err}")
+    def report(row_id: int, file_name: str, err: str | None) -> None:
+        if err is None:
+            logger.success(f"Parsed id={row_id} file={file_name}")
+            return
+        failures.append((row_id, err))
+        logger.error(f"Failed id={row_id} file={file_name}: {err}")
+
+    # Decrypt + parse on every core while the next ciphertexts are fetched over SSH.
+    # Submissions are capped so at most 2 * workers plaintexts wait in the pool.
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=init_worker, initargs=(master_key,)
+    ) as pool:
+        in_flight: deque[tuple[int, str, Future]] = deque()
+        rows = _iter_ready_rows(ids, limit)
+        inputs = _prefetch_inputs(rows, max(prefetch, 1), plaintext_cache)
+        for row, fetched in inputs:
+            total += 1
+            try:
+                data, is_plaintext = fetched.result()
+            except Exception as e:
+                report(row.id, row.file_name, str(e))
+                continue
+            future = pool.submit(
+                parse_statement,
+                row.id,
+                row.file_name,
+                row.init_vector,
+                row.auth_tag,
+                row.metadata_field,
+                data,
+                is_plaintext,
+                plaintext_cache,
+            )
+            in_flight.append((row.id, row.file_name, future))
+            if len(in_flight) >= 2 * workers:
+                row_id, file_name, future = in_flight.popleft()
+                report(row_id, file_name, future.result())
+        while in_flight:
+            row_id, file_name, future = in_flight.popleft()
+            report(row_id, file_name, future.result())
 
     logger.info(f"Processed {total} statements; {len(failures)} failures.")
     if failures:
@@ -92,8 +173,44 @@ def main():
     parser.add_argument(
         "--limit", type=int, help="Optional limit on number of statements."
     )
+    parser.add_argument(
+        "--prefetch",
+        type=int,
+        default=4,
+        help="Number of encrypted files to fetch ahead of parsing (default: 4).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Processes used to decrypt and parse (default: CPU count).",
+    )
+    parser.add_argument(
+        "--rebuild-plugins",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Recompile plugins before running even if their sources are unchanged "
+            "(default: recompile only after a plugin source changes)."
+        ),
+    )
+    parser.add_argument(
+        "--plaintext-cache",
+        action=argparse.BooleanOptionalAction,
+        default=False,
+        help=(
+            "Reuse decrypted statements from ~/.cache/parsetrail/plaintext and "
+            "store new ones there (default: off; the files are unencrypted)."
+        ),
+    )
     args = parser.parse_args()
-    exit_code = run(ids=args.ids, limit=args.limit)
+    exit_code = run(
+        ids=args.ids,
+        limit=args.limit,
+        prefetch=args.prefetch,
+        workers=args.workers,
+        rebuild_plugins=args.rebuild_plugins,
+        plaintext_cache=args.plaintext_cache,
+    )
     raise SystemExit(exit_code)
 
 
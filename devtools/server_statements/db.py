@@ -6,7 +6,7 @@ import time
 from typing import Optional, Tuple
 
 from settings import settings
-from ssh import fetch_remote_env
+from ssh import fetch_remote_env_many
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -30,7 +30,7 @@ def _load_remote_db_env() -> dict:
         "POSTGRES_PASSWORD",
         "POSTGRES_DB",
     ]
-    values = {k: fetch_remote_env(k) for k in keys}
+    values = fetch_remote_env_many(keys)
     # Cast numeric fields
     values["POSTGRES_PORT"] = int(values["POSTGRES_PORT"])
     _REMOTE_DB_ENV = values
@@ -46,8 +46,12 @@ def _driver_prefix() -> str:
     return "postgresql://"
 
 
+# Installed drivers don't change while the process runs, so resolve this once
+_DRIVER_PREFIX = _driver_prefix()
+
+
 def _build_database_url(host: str, port: int) -> str:
-    prefix = _driver_prefix()
+    prefix = _DRIVER_PREFIX
     db_env = _load_remote_db_env()
     return (
         f"{prefix}{db_env['POSTGRES_USER']}:{db_env['POSTGRES_PASSWORD']}"
@@ -140,7 +144,14 @@ def get_engine():
         host, port = _ensure_tunnel()
 
     url = _build_database_url(host, port)
-    _engine = create_engine(url, pool_size=5, max_overflow=10)
+    connect_args = {}
+    if _DRIVER_PREFIX == "postgresql+psycopg://":
+        # Prepare repeated queries server-side from their first run, saving a parse
+        # and plan per execution on the tunneled connection
+        connect_args["prepare_threshold"] = 1
+    _engine = create_engine(
+        url, pool_size=5, max_overflow=10, connect_args=connect_args
+    )
     _SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=_engine)
     return _engine
 
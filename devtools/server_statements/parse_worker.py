@@ -0,0 +1,66 @@
+"""
+Process-pool worker for batch_plugin_tester.
+
+Decrypts and parses a single statement. Deliberately avoids importing db so that
+spawned workers don't each fetch DB settings or open their own SSH tunnel.
+"""
+
+import sys
+from pathlib import Path
+
+import aes_cache
+from aes import decrypt_ciphertext, parse_metadata
+from sqlalchemy.orm import sessionmaker
+
+# Make the client modules importable
+CLIENT_SRC = Path(__file__).resolve().parents[2] / "client" / "src"
+if not CLIENT_SRC.exists():
+    raise ImportError("Unable to import ParseTrail client modules")
+sys.path.insert(0, str(CLIENT_SRC))
+
+from parsetrail.core.parse import ParseInput, parse_any  # noqa: E402
+from parsetrail.core.plugins import PluginManager  # noqa: E402
+
+_master_key: bytes | None = None
+_plugin_manager: PluginManager | None = None
+
+
+def init_worker(master_key: bytes) -> None:
+    """Keep the master key and load the compiled plugins once per worker."""
+    global _master_key, _plugin_manager
+    _master_key = master_key
+    _plugin_manager = PluginManager()
+    _plugin_manager.load_plugins()
+
+
+def parse_statement(
+    row_id: int,
+    file_name: str,
+    init_vector: bytes,
+    auth_tag: bytes,
+    metadata_field: str | None,
+    data: bytes,
+    is_plaintext: bool = False,
+    cache_plaintext: bool = False,
+) -> str | None:
+    """Decrypt and parse one statement, returning the error message on failure.
+
+    `data` is ciphertext unless `is_plaintext` (a plaintext cache hit). With
+    `cache_plaintext`, freshly decrypted plaintext is written to aes_cache.
+    """
+    try:
+        if is_plaintext:
+            plaintext = data
+        else:
+            plaintext = decrypt_ciphertext(_master_key, init_vector, auth_tag, data)
+            if cache_plaintext:
+                aes_cache.store(row_id, auth_tag, plaintext)
+        metadata = parse_metadata(metadata_field)
+        fname = metadata.get("filename") or metadata.get("file_name") or file_name
+        suffix = Path(fname).suffix or ".bin"
+        parse_input = ParseInput(name=fname, suffix=suffix.lower(), data=plaintext)
+        # parse_any only holds on to the sessionmaker, so an unbound one is enough here
+        parse_any(sessionmaker(), _plugin_manager, parse_input, hard_fail=False)
+    except Exception as e:
+        return str(e)
+    return None
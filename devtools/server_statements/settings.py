@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
@@ -7,8 +8,6 @@ from typing_extensions import Self
 
 # Use project-level .env
 ENV_FILE = Path(__file__).resolve().parents[2] / ".env"
-if not ENV_FILE.exists():
-    raise FileNotFoundError(f"Project-level .env not fount at {ENV_FILE}")
 
 
 class Settings(BaseSettings):
@@ -40,6 +39,7 @@ class Settings(BaseSettings):
     REMOTE_USER: str = ""
     REMOTE_ENV_PATH: str = ""
     REMOTE_STATEMENTS_DIR: str = ""
+    SSH_CONTROL_PERSIST: int = 600  # seconds to keep a shared connection; 0 disables
 
     # DB tunneling (via ssh -L)
     SSH_TUNNEL_ENABLE: bool = False
@@ -66,4 +66,16 @@ class Settings(BaseSettings):
         return self
 
 
-settings = Settings()  # type: ignore
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Read and validate the project .env on first use rather than at import."""
+    if not ENV_FILE.exists():
+        raise FileNotFoundError(f"Project-level .env not fount at {ENV_FILE}")
+    return Settings()  # type: ignore
+
+
+def __getattr__(name: str):
+    # Keep `from settings import settings` working, built lazily on first import
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,26 +1,69 @@
 import base64
+import os
 import subprocess
 from pathlib import Path
 
-from settings import settings
+from settings import get_settings
 
 _MASTER_KEY_CACHE: bytes | None = None
+_REMOTE_ENV_FILE: dict[str, str] | None = None
 
 
 def _ssh_cmd(base: list[str]) -> list[str]:
+    settings = get_settings()
     cmd = ["ssh"]
     if settings.SSH_KEY_PATH:
         cmd += ["-i", settings.SSH_KEY_PATH]
+    # Statements are AES-GCM ciphertext and don't compress, so never spend CPU on it
+    # (this also covers a shared master connection opened by any of these calls)
+    cmd += ["-o", "Compression=no"]
+    cmd += _multiplex_opts()
     cmd += base
     return cmd
 
 
+def _multiplex_opts() -> list[str]:
+    """Share one authenticated connection across ssh calls (OpenSSH on POSIX only)."""
+    settings = get_settings()
+    if os.name == "nt" or settings.SSH_CONTROL_PERSIST <= 0:
+        return []
+    return [
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        "ControlPath=~/.ssh/parsetrail-%C",
+        "-o",
+        f"ControlPersist={settings.SSH_CONTROL_PERSIST}",
+    ]
+
+
 def fetch_remote_env(var_name: str) -> str:
+    return fetch_remote_env_many([var_name])[var_name]
+
+
+def fetch_remote_env_many(var_names: list[str]) -> dict[str, str]:
+    """Read several variables from the remote env file (fetched once per session)."""
+    env = _remote_env_file()
+    values: dict[str, str] = {}
+    for var_name in var_names:
+        if var_name not in env:
+            raise ValueError(f"{var_name} not found in remote env file")
+        values[var_name] = env[var_name]
+    return values
+
+
+def _remote_env_file() -> dict[str, str]:
+    """Copy the whole remote env file over a single SSH call and parse KEY=VALUE."""
+    global _REMOTE_ENV_FILE
+    if _REMOTE_ENV_FILE is not None:
+        return _REMOTE_ENV_FILE
+
+    settings = get_settings()
     if not settings.REMOTE_HOST or not settings.REMOTE_USER:
         raise ValueError(
             "REMOTE_HOST and REMOTE_USER are required to fetch MASTER_KEY remotely"
         )
-    remote_cmd = f"grep '^{var_name}=' {settings.REMOTE_ENV_PATH}"
+    remote_cmd = f"cat {settings.REMOTE_ENV_PATH}"
     cmd = _ssh_cmd(
         [
             f"{settings.REMOTE_USER}@{settings.REMOTE_HOST}",
@@ -28,14 +71,19 @@ def fetch_remote_env(var_name: str) -> str:
         ]
     )
     result = subprocess.run(cmd, capture_output=True, check=True, text=True)
+    env: dict[str, str] = {}
     for line in result.stdout.splitlines():
-        if line.startswith(f"{var_name}="):
-            return line.split("=", 1)[1].strip()
-    raise ValueError(f"{var_name} not found in remote env file")
+        name, sep, value = line.partition("=")
+        # First definition wins, as it did with the old per-variable grep
+        if sep and name not in env:
+            env[name] = value.strip()
+    _REMOTE_ENV_FILE = env
+    return env
 
 
 def fetch_encrypted_file(file_name: str) -> bytes:
     """Read the encrypted file either locally or via SSH."""
+    settings = get_settings()
     if settings.ENVIRONMENT == "local":
         remote_path = f"{settings.REMOTE_STATEMENTS_DIR.rstrip('/')}/{file_name}"
         remote_cmd = f"cat {remote_path}"
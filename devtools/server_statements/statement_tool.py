@@ -1,13 +1,18 @@
-import json
 import subprocess
 import sys
 from pathlib import Path
 
-from aes import decrypt_statement
+from aes import decrypt_statement, parse_metadata
 from db import SessionLocal
 from loguru import logger
 from orm import StatementUploads
-from PyQt5.QtCore import QAbstractTableModel, QModelIndex, QSortFilterProxyModel, Qt
+from PyQt5.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QSortFilterProxyModel,
+    Qt,
+    QTimer,
+)
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtWidgets import (
     QApplication,
@@ -25,6 +30,7 @@ from PyQt5.QtWidgets import (
     QVBoxLayout,
     QWidget,
 )
+from sqlalchemy import update
 
 
 # Make the client modules importable
@@ -37,7 +43,7 @@ try:
     from parsetrail.core.parse import ParseInput
     from parsetrail.core.plugins import PluginManager
     from parsetrail.gui.plugins import ParseTestDialog
-    from parsetrail.build_plugins import main as build_plugins
+    from parsetrail.build_plugins import main as build_plugins, source_signature
 except Exception as e:  # pragma: no cover - optional dependency
     logger.warning(f"Unable to import ParseTrail client modules: {e}")
     raise
@@ -55,12 +61,26 @@ class StatementTableModel(QAbstractTableModel):
     def __init__(self, rows: list[StatementUploads] | None = None):
         super().__init__()
         self.rows: list[StatementUploads] = rows or []
+        self.haystacks: list[str] = [self._haystack(row) for row in self.rows]
 
     def set_rows(self, rows: list[StatementUploads]):
         self.beginResetModel()
         self.rows = rows
+        self.haystacks = [self._haystack(row) for row in rows]
         self.endResetModel()
 
+    @staticmethod
+    def _haystack(row: StatementUploads) -> str:
+        """Lowercased text the filter box searches, built once per row."""
+        return " ".join(
+            [
+                row.file_name or "",
+                row.metadata_field or "",
+                row.plugin_status or "",
+                str(row.user_id) if row.user_id else "",
+            ]
+        ).lower()
+
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # type: ignore[override]
         return len(self.rows)
 
@@ -108,19 +128,12 @@ class StatementFilterProxy(QSortFilterProxyModel):
         model = self.sourceModel()
         if not isinstance(model, StatementTableModel):
             return True
-        row = model.rows[source_row]
-        haystack = " ".join(
-            [
-                row.file_name or "",
-                row.metadata_field or "",
-                row.plugin_status or "",
-                str(row.user_id) if row.user_id else "",
-            ]
-        ).lower()
-        return self.filter_text in haystack
+        return self.filter_text in model.haystacks[source_row]
 
 
 class StatementTool(QMainWindow):
+    PAGE_SIZE = 500
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle("Statement Browser (dev)")
@@ -149,14 +162,31 @@ class StatementTool(QMainWindow):
         filter_label = QLabel("Filter:")
         self.filter_input = QLineEdit()
         self.filter_input.setPlaceholderText("file_name, metadata, user_id")
-        self.filter_input.textChanged.connect(self.proxy.setFilterText)
+        # Wait for a pause in typing before re-filtering every row
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(150)
+        self.filter_timer.timeout.connect(
+            lambda: self.proxy.setFilterText(self.filter_input.text())
+        )
+        self.filter_input.textChanged.connect(lambda _: self.filter_timer.start())
 
         refresh_btn = QPushButton("Refresh")
         refresh_btn.clicked.connect(self.load_rows)
 
+        self.page = 0
+        self.prev_btn = QPushButton("< Prev")
+        self.prev_btn.clicked.connect(lambda: self.change_page(-1))
+        self.next_btn = QPushButton("Next >")
+        self.next_btn.clicked.connect(lambda: self.change_page(1))
+        self.page_label = QLabel()
+
         decrypt_btn = QPushButton("Decrypt && Parse")
         decrypt_btn.clicked.connect(self.decrypt_and_parse)
 
+        rebuild_btn = QPushButton("Rebuild Plugins")
+        rebuild_btn.clicked.connect(self.rebuild_plugins)
+
         mark_pending_btn = QPushButton("Mark Pending")
         mark_pending_btn.clicked.connect(lambda: self.update_status("pending"))
         mark_ready_btn = QPushButton("Mark Ready")
@@ -166,7 +196,11 @@ class StatementTool(QMainWindow):
         toolbar.addWidget(filter_label)
         toolbar.addWidget(self.filter_input)
         toolbar.addWidget(refresh_btn)
+        toolbar.addWidget(self.prev_btn)
+        toolbar.addWidget(self.page_label)
+        toolbar.addWidget(self.next_btn)
         toolbar.addWidget(decrypt_btn)
+        toolbar.addWidget(rebuild_btn)
         toolbar.addWidget(mark_pending_btn)
         toolbar.addWidget(mark_ready_btn)
         toolbar.addStretch()
@@ -180,30 +214,49 @@ class StatementTool(QMainWindow):
         self.setCentralWidget(container)
 
         self.plugin_manager = PluginManager()
+        self.plugins_signature: tuple | None = None
         self.session_maker = SessionLocal
 
         self.table.clicked.connect(self.show_metadata_dialog)
         self.load_rows()
 
     def load_rows(self):
+        """Load one page of rows, projecting only the columns the table displays."""
         try:
             with self.session_maker() as session:
                 rows = (
-                    session.query(StatementUploads)
+                    session.query(
+                        StatementUploads.id,
+                        StatementUploads.file_name,
+                        StatementUploads.metadata_field,
+                        StatementUploads.plugin_status,
+                        StatementUploads.user_id,
+                    )
                     .order_by(StatementUploads.id.desc())
+                    .limit(self.PAGE_SIZE + 1)
+                    .offset(self.page * self.PAGE_SIZE)
                     .all()
                 )
-            self.model.set_rows(rows)
+            # The extra row only tells us whether a next page exists
+            has_next = len(rows) > self.PAGE_SIZE
+            self.model.set_rows(rows[: self.PAGE_SIZE])
+            self.prev_btn.setEnabled(self.page > 0)
+            self.next_btn.setEnabled(has_next)
+            self.page_label.setText(f"Page {self.page + 1}")
         except Exception as e:
             QMessageBox.critical(self, "Database Error", str(e))
 
+    def change_page(self, step: int):
+        self.page = max(self.page + step, 0)
+        self.load_rows()
+
     def show_metadata_dialog(self, proxy_index: QModelIndex):
         try:
             row = self.model.get_row(proxy_index, self.proxy)
         except Exception:
             return
 
-        metadata = self._parse_metadata_field(row.metadata_field or "")
+        metadata = parse_metadata(row.metadata_field)
         dialog = QDialog(self)
         dialog.setWindowTitle("Metadata")
 
@@ -214,6 +267,9 @@ class StatementTool(QMainWindow):
         table.horizontalHeader().setStretchLastSection(True)
         table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeToContents)
 
+        # Fill in bulk without per-item change signals or repaints
+        table.setUpdatesEnabled(False)
+        table.blockSignals(True)
         if metadata:
             table.setRowCount(len(metadata))
             for i, (k, v) in enumerate(metadata.items()):
@@ -223,6 +279,8 @@ class StatementTool(QMainWindow):
             table.setRowCount(1)
             table.setItem(0, 0, QTableWidgetItem("_raw"))
             table.setItem(0, 1, QTableWidgetItem(row.metadata_field or ""))
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
 
         layout = QVBoxLayout()
         layout.addWidget(table)
@@ -239,7 +297,13 @@ class StatementTool(QMainWindow):
             return
         try:
             row = self.model.get_row(idx, self.proxy)
-            plaintext, metadata = decrypt_statement(row)
+            # The table only holds display columns; fetch the IV and auth tag now
+            with self.session_maker() as session:
+                full_row = session.get(StatementUploads, row.id)
+            if full_row is None:
+                QMessageBox.warning(self, "Not Found", f"Row id {row.id} not found.")
+                return
+            plaintext, metadata = decrypt_statement(full_row)
             summary = self._parse_with_client(plaintext, row.file_name, metadata)
             QMessageBox.information(self, "Exit Status", summary)
         except subprocess.CalledProcessError as e:
@@ -262,13 +326,17 @@ class StatementTool(QMainWindow):
             return
         try:
             with self.session_maker() as session:
-                db_row = session.query(StatementUploads).get(row.id)
-                if not db_row:
+                result = session.execute(
+                    update(StatementUploads)
+                    .where(StatementUploads.id == row.id)
+                    .values(plugin_status=status)
+                    .execution_options(synchronize_session=False)
+                )
+                if result.rowcount == 0:
                     QMessageBox.warning(
                         self, "Not Found", f"Row id {row.id} not found."
                     )
                     return
-                db_row.plugin_status = status
                 session.commit()
             self.load_rows()
             QMessageBox.information(
@@ -283,9 +351,8 @@ class StatementTool(QMainWindow):
         if not all([self.plugin_manager, ParseTestDialog]):
             return "Parsing unavailable: client modules not loaded"
 
-        # Recompile plugins for each call, since dev may have updated them.
-        build_plugins()
-        self.plugin_manager.load_plugins()
+        # Dev may have updated the plugins since the last parse
+        self._ensure_plugins()
 
         fname = metadata.get("filename") or metadata.get("file_name") or enc_name
         suffix = Path(fname).suffix or ".bin"
@@ -306,18 +373,22 @@ class StatementTool(QMainWindow):
             dialog = None
             parse_input = None
 
-    def _parse_metadata_field(self, raw: str) -> dict:
-        if not raw:
-            return {}
+    def rebuild_plugins(self):
         try:
-            return json.loads(raw)
-        except Exception:
-            if not raw.strip().endswith("}"):
-                try:
-                    return json.loads(raw + '"}')
-                except Exception:
-                    pass
-        return {}
+            self._ensure_plugins(force=True)
+            QMessageBox.information(
+                self, "Plugins", "Plugins rebuilt and reloaded."
+            )
+        except Exception as e:
+            QMessageBox.critical(self, "Plugin Error", str(e))
+
+    def _ensure_plugins(self, force: bool = False) -> None:
+        """Recompile and reload plugins when their sources changed since last build."""
+        signature = source_signature()
+        if force or signature != self.plugins_signature:
+            build_plugins()
+            self.plugin_manager.load_plugins()
+            self.plugins_signature = signature
 
 
 def main():
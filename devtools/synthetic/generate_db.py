@@ -8,13 +8,17 @@ Usage:
 from __future__ import annotations
 
 import argparse
-import hashlib
-import random
 import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
+from functools import partial
+from itertools import count, groupby
+from operator import itemgetter
 from pathlib import Path
 
+import numpy as np
 from sqlalchemy import text
 from sqlalchemy.orm import Session
 
@@ -71,6 +75,13 @@ CATEGORIES = [
     ("Refund", "Adjustments"),
 ]
 
+# Categories a spend event can land in (income and transfers are never spends)
+SPEND_CATEGORIES = tuple(
+    (name, cat_type)
+    for name, cat_type in CATEGORIES
+    if cat_type not in {"Income", "Transfer"}
+)
+
 MERCHANTS = {
     "Groceries": ["Fresh Fields", "GreenMart", "Daily Market", "Food Junction"],
     "Dining": ["Noodle House", "Cafe Aurora", "Pizzeria Uno", "Taco Villa"],
@@ -86,13 +97,30 @@ MERCHANTS = {
     "Refund": ["Refund"],
 }
 
+# Columns returned by generate_transactions_for_account, in tuple order
+TX_COLUMNS = ("Date", "Amount", "Balance", "Description", "CategoryID", "Verified")
+
+# Merchant names as object arrays so a category's picks can be fancy-indexed at once
+MERCHANT_CHOICES = {
+    category: np.array(names, dtype=object) for category, names in MERCHANTS.items()
+}
+
+# Transactions per bulk insert; bounds the buffered row dicts for long histories
+INSERT_BATCH = 5000
 
-def sha_md5(*parts: str) -> str:
-    h = hashlib.md5()
-    random.random()
-    text = "|".join(parts) + str(random.random())
-    h.update(text.encode())
-    return h.hexdigest()
+
+# Source of synthetic_md5 values; restarted per build so a seed gives the same DB
+_md5_sequence = count()
+
+
+def synthetic_md5() -> str:
+    """
+    Next value for an MD5 column, formatted like a digest.
+
+    Synthetic rows have no source file or content to hash; the columns only need
+    unique values (Transactions.MD5 is UNIQUE), so a counter replaces hashing.
+    """
+    return f"{next(_md5_sequence):032x}"
 
 
 def month_range(start: date, months: int) -> tuple[date, date]:
@@ -107,129 +135,150 @@ def month_range(start: date, months: int) -> tuple[date, date]:
     return period_start, period_end
 
 
-def pick_merchant(category: str) -> str:
-    choices = MERCHANTS.get(category, ["Vendor"])
-    return random.choice(choices)
-
-
 def generate_transactions_for_account(
     spec: AccountSpec,
     start_date: date,
     end_date: date,
-    categories: dict[str, orm.Categories],
-) -> list[dict]:
-    txs: list[dict] = []
+    categories: dict[str, int],
+    rng: np.random.Generator,
+) -> dict[str, list]:
+    """
+    Simulate daily activity and return it column-wise, keyed by TX_COLUMNS.
+    """
+    days = np.arange(np.datetime64(start_date, "D"), np.datetime64(end_date, "D") + 1)
+    n_days = len(days)
+    date_strs = np.datetime_as_string(days, unit="D").tolist()
+    day_of_month = (days - days.astype("datetime64[M]")).astype(int) + 1
+    is_payday = np.isin(day_of_month, (1, 15)).tolist()
+    max_events = max(1, int(spec.spend_events_per_day))
+
+    # Draw every random number up front in a few vectorized calls; the daily loop
+    # below only carries the running balance, which the drift cap makes serial.
+    drift_rates = rng.normal(spec.drift_bias, spec.volatility, n_days).tolist()
+    # Thin the daily draws by the spend share so event density matches drawing from
+    # every category and skipping income/transfer picks
+    events_per_day = rng.binomial(
+        rng.integers(0, max_events + 1, n_days), len(SPEND_CATEGORIES) / len(CATEGORIES)
+    )
+    n_events = int(events_per_day.sum())
+    event_categories = rng.integers(0, len(SPEND_CATEGORIES), n_events)
+    event_merchants = np.full(n_events, "Vendor", dtype=object)
+    for category_index, (category_name, _) in enumerate(SPEND_CATEGORIES):
+        choices = MERCHANT_CHOICES.get(category_name)
+        if choices is None:
+            continue
+        mask = event_categories == category_index
+        picks = rng.integers(0, len(choices), int(mask.sum()))
+        event_merchants[mask] = choices[picks]
+    event_categories = event_categories.tolist()
+    event_merchants = event_merchants.tolist()
+    spend_range = rng.uniform(spec.spend_min, spec.spend_max, n_events)
+    spend_amounts = np.round(spend_range * spec.expense_bias, 2).tolist()
+    fee_draws = rng.random(n_days).tolist()
+    fee_amounts = np.round(rng.uniform(1, 10, n_days), 2).tolist()
+    refund_draws = rng.random(n_days).tolist()
+    refund_amounts = np.round(rng.uniform(5, 150, n_days), 2).tolist()
+    events_per_day = events_per_day.tolist()
+
+    # The balance walk is serial, so keep per-row work in the loop to a minimum:
+    # resolve category IDs and account parameters once rather than per transaction
+    salary_id = categories["Salary"]
+    drift_id = categories["Investments"]
+    fee_id = categories["Fees"]
+    refund_id = categories["Refund"]
+    spend_ids = [
+        categories.get(name, categories["Shopping"]) for name, _ in SPEND_CATEGORIES
+    ]
+    paycheck = spec.income_monthly / 2.0 if spec.income_monthly > 0 else 0.0
+    cap_abs = spec.drift_cap_abs
+    cap_multiplier = spec.drift_cap_multiplier
+
+    # One tuple per transaction, transposed into columns at the end
+    rows: list[tuple] = []
+    append = rows.append
     balance = spec.starting_balance
+    has_drift = spec.asset_type.lower() != "debt"
+    event = 0
+
+    for day in range(n_days):
+        date_str = date_strs[day]
 
-    current = start_date
-    while current <= end_date:
         # Income events (1st and 15th)
-        if spec.income_monthly > 0 and current.day in (1, 15):
-            amount = spec.income_monthly / 2.0
-            balance += amount
-            txs.append(
-                {
-                    "Date": current.isoformat(),
-                    "Amount": amount,
-                    "Balance": balance,
-                    "Description": "Payroll Deposit",
-                    "Category": categories["Salary"],
-                    "Verified": 1,
-                }
-            )
+        if paycheck and is_payday[day]:
+            balance += paycheck
+            append((date_str, paycheck, balance, "Payroll Deposit", salary_id, 1))
 
         # Time-dependent drift (random walk) to create variability without runaway
-        drift_amount = 0.0
-        if spec.asset_type.lower() != "debt":
-            drift_rate = random.gauss(spec.drift_bias, spec.volatility)
-            drift_amount = balance * drift_rate if balance else random.uniform(-25, 25)
-            cap = max(
-                spec.drift_cap_abs,
-                spec.drift_cap_multiplier * abs(balance) if balance else 0.0,
-            )
+        if has_drift:
+            drift_rate = drift_rates[day]
+            drift_amount = balance * drift_rate if balance else rng.uniform(-25, 25)
+            cap = max(cap_abs, cap_multiplier * abs(balance) if balance else 0.0)
             drift_amount = max(-cap, min(cap, drift_amount))
             balance += drift_amount
-            txs.append(
-                {
-                    "Date": current.isoformat(),
-                    "Amount": drift_amount,
-                    "Balance": balance,
-                    "Description": "Daily drift",
-                    "Category": categories["Investments"],
-                    "Verified": 0,
-                }
-            )
+            append((date_str, drift_amount, balance, "Daily drift", drift_id, 0))
 
         # Daily spending (halve frequency)
-        daily_spend_events = random.randint(0, max(1, int(spec.spend_events_per_day)))
-        for _ in range(daily_spend_events):
-            category_name, category_type = random.choice(CATEGORIES)
-            if category_type in {"Income", "Transfer"}:
-                continue
+        next_event = event + events_per_day[day]
+        for i in range(event, next_event):
             # Per-account spend range
-            amount = round(
-                random.uniform(spec.spend_min, spec.spend_max) * spec.expense_bias, 2
-            )
+            amount = spend_amounts[i]
             balance -= amount
-            merchant = pick_merchant(category_name)
-            txs.append(
-                {
-                    "Date": current.isoformat(),
-                    "Amount": -amount,
-                    "Balance": balance,
-                    "Description": f"{merchant}",
-                    "Category": categories.get(category_name, categories["Shopping"]),
-                    "Verified": 0,
-                }
-            )
+            merchant = event_merchants[i]
+            category_id = spend_ids[event_categories[i]]
+            append((date_str, -amount, balance, merchant, category_id, 0))
+        event = next_event
 
         # Occasional fees/refunds
-        if random.random() < 0.0001:
-            fee = round(random.uniform(1, 10), 2)
+        if fee_draws[day] < 0.0001:
+            fee = fee_amounts[day]
             balance -= fee
-            txs.append(
-                {
-                    "Date": current.isoformat(),
-                    "Amount": -fee,
-                    "Balance": balance,
-                    "Description": "Service Fee",
-                    "Category": categories["Fees"],
-                    "Verified": 0,
-                }
-            )
-        if random.random() < 0.02:
-            refund = round(random.uniform(5, 150), 2)
+            append((date_str, -fee, balance, "Service Fee", fee_id, 0))
+        if refund_draws[day] < 0.02:
+            refund = refund_amounts[day]
             balance += refund
-            txs.append(
-                {
-                    "Date": current.isoformat(),
-                    "Amount": refund,
-                    "Balance": balance,
-                    "Description": "Refund",
-                    "Category": categories["Refund"],
-                    "Verified": 0,
-                }
-            )
+            append((date_str, refund, balance, "Refund", refund_id, 0))
+
+    columns = zip(*rows) if rows else ((),) * len(TX_COLUMNS)
+    return {name: list(column) for name, column in zip(TX_COLUMNS, columns)}
 
-        current += timedelta(days=1)
 
-    return txs
+def _generate_account(
+    spec: AccountSpec,
+    start_date: date,
+    end_date: date,
+    categories: dict[str, int],
+    seed: int,
+) -> dict[str, list]:
+    """
+    Generate one account from its own RNG stream (module level so pools can pickle it).
+    """
+    # Keyed on the account name (crc32, since str hashes vary per process) so each
+    # account's history is independent of the others and of the order they run in
+    rng = np.random.default_rng([seed, zlib.crc32(spec.name.encode())])
+    return generate_transactions_for_account(
+        spec, start_date, end_date, categories, rng
+    )
 
 
-def create_synthetic_db(output: Path, years: int, seed: int) -> Path:
-    random.seed(seed)
+def create_synthetic_db(output: Path, years: int, seed: int, workers: int = 1) -> Path:
+    global _md5_sequence
+    _md5_sequence = count()
     output.parent.mkdir(parents=True, exist_ok=True)
 
     SessionLocal = orm.create_database(output)
     with SessionLocal() as session:
+        _tune_sqlite(session)
         _reset_tables(session)
-        _populate(session, years)
+        _populate(session, years, seed, workers)
         _set_alembic_version(session)
         session.commit()
     return output
 
 
-def _populate(session: Session, years: int) -> None:
+def _populate(session: Session, years: int, seed: int, workers: int = 1) -> None:
+    # Every synthetic statement is "imported" by this one run
+    import_date = datetime.utcnow().isoformat()
+
     # Account types (avoid duplicates if the DB already has entries)
     type_map = {}
     required_types = [
@@ -242,32 +291,37 @@ def _populate(session: Session, years: int) -> None:
         ("TangibleAsset", "TangibleAsset"),
         ("Brokerage", "Asset"),  # used by synthetic accounts
     ]
-    for name, asset in required_types:
-        existing = (
-            session.query(orm.AccountTypes).filter_by(AccountType=name).one_or_none()
+    existing_types = {
+        t.AccountType: t
+        for t in session.query(orm.AccountTypes).filter(
+            orm.AccountTypes.AccountType.in_([name for name, _ in required_types])
         )
+    }
+    for name, asset in required_types:
+        existing = existing_types.get(name)
         if existing:
             # Ensure AssetType matches desired value
             if existing.AssetType != asset:
                 existing.AssetType = asset
             type_map[name] = existing
             continue
-        obj = orm.AccountTypes(AccountType=name, AssetType=asset)
-        session.add(obj)
-        session.flush()
-        type_map[name] = obj
+        type_map[name] = orm.AccountTypes(AccountType=name, AssetType=asset)
+    session.add_all(t for name, t in type_map.items() if name not in existing_types)
 
     # Categories
-    category_map: dict[str, orm.Categories] = {}
-    for name, cat_type in CATEGORIES:
-        existing = session.query(orm.Categories).filter_by(Name=name).one_or_none()
-        if existing:
-            category_map[name] = existing
-            continue
-        cat = orm.Categories(Name=name, Type=cat_type, Active=1)
-        session.add(cat)
-        session.flush()
-        category_map[name] = cat
+    category_map: dict[str, orm.Categories] = {
+        c.Name: c
+        for c in session.query(orm.Categories).filter(
+            orm.Categories.Name.in_([name for name, _ in CATEGORIES])
+        )
+    }
+    new_categories = [
+        orm.Categories(Name=name, Type=cat_type, Active=1)
+        for name, cat_type in CATEGORIES
+        if name not in category_map
+    ]
+    session.add_all(new_categories)
+    category_map.update((cat.Name, cat) for cat in new_categories)
 
     # Plugins (single synthetic plugin)
     plugin = orm.Plugins(
@@ -278,7 +332,9 @@ def _populate(session: Session, years: int) -> None:
         StatementType="Synthetic Statement",
     )
     session.add(plugin)
+    # One flush assigns the AccountType, Category, and Plugin IDs used below
     session.flush()
+    category_ids = {name: cat.CategoryID for name, cat in category_map.items()}
 
     # Accounts (renamed/retyped to match behavioral patterns)
     specs = [
@@ -359,92 +415,172 @@ def _populate(session: Session, years: int) -> None:
     start_date = date.today().replace(day=1) - timedelta(days=365 * years)
     end_date = date.today()
 
-    for spec in specs:
-        existing_account = (
-            session.query(orm.Accounts).filter_by(AccountName=spec.name).one_or_none()
+    account_map: dict[str, orm.Accounts] = {
+        a.AccountName: a
+        for a in session.query(orm.Accounts).filter(
+            orm.Accounts.AccountName.in_([spec.name for spec in specs])
         )
-        if existing_account:
-            account = existing_account
-        else:
-            account = orm.Accounts(
-                AccountName=spec.name,
-                AccountTypeID=type_map[spec.type_name].AccountTypeID,
-                Company=spec.company,
-                Description=f"Synthetic {spec.type_name} account",
-                AppreciationRate=0,
-            )
-            session.add(account)
-            session.flush()
-
-        existing_number = (
-            session.query(orm.AccountNumbers)
-            .filter_by(AccountID=account.AccountID, AccountNumber=spec.account_number)
-            .one_or_none()
+    }
+    new_accounts = [
+        orm.Accounts(
+            AccountName=spec.name,
+            AccountTypeID=type_map[spec.type_name].AccountTypeID,
+            Company=spec.company,
+            Description=f"Synthetic {spec.type_name} account",
+            AppreciationRate=0,
         )
-        if not existing_number:
-            session.add(
-                orm.AccountNumbers(
-                    AccountID=account.AccountID,
-                    AccountNumber=spec.account_number,
-                )
-            )
+        for spec in specs
+        if spec.name not in account_map
+    ]
+    session.add_all(new_accounts)
+    session.flush()
+    account_map.update((account.AccountName, account) for account in new_accounts)
 
-        txs = generate_transactions_for_account(
-            spec, start_date, end_date, category_map
+    existing_numbers = set(
+        session.query(orm.AccountNumbers.AccountID, orm.AccountNumbers.AccountNumber)
+        .filter(
+            orm.AccountNumbers.AccountID.in_(
+                [account.AccountID for account in account_map.values()]
+            )
+        )
+        .all()
+    )
+    session.add_all(
+        orm.AccountNumbers(
+            AccountID=account_map[spec.name].AccountID,
+            AccountNumber=spec.account_number,
         )
+        for spec in specs
+        if (account_map[spec.name].AccountID, spec.account_number)
+        not in existing_numbers
+    )
 
-        # Group into monthly statements
-        month = 0
-        while True:
-            period_start, period_end = month_range(start_date, month)
-            month += 1
-            if period_start > end_date:
-                break
+    # Accounts simulate independently; only the inserts below need to be serial
+    generate = partial(
+        _generate_account,
+        start_date=start_date,
+        end_date=end_date,
+        categories=category_ids,
+        seed=seed,
+    )
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(specs))) as pool:
+            account_txs = list(pool.map(generate, specs))
+    else:
+        account_txs = [generate(spec) for spec in specs]
+
+    for spec, txs in zip(specs, account_txs):
+        account = account_map[spec.name]
+
+        # Group into monthly statements. Rows are built as plain dicts and inserted in
+        # bulk about INSERT_BATCH transactions at a time; transactions are keyed by
+        # statement StartDate until the StatementIDs exist.
+        stmt_rows: list[dict] = []
+        tx_rows_by_start: dict[str, list[dict]] = {}
+        pending = 0
+        dates = txs["Date"]
+        amounts = txs["Amount"]
+        balances = txs["Balance"]
+        descriptions = txs["Description"]
+        category_ids_col = txs["CategoryID"]
+        verified = txs["Verified"]
+        # txs are generated in date order and ISO dates sort lexically, so one pass
+        # grouped on "YYYY-MM" yields each non-empty month in turn
+        first = 0
+        for year_month, group in groupby(dates, key=itemgetter(slice(0, 7))):
+            last = first + sum(1 for _ in group)
+            # The statement period starts on the 1st, so its ISO string is known
+            start_str = f"{year_month}-01"
+            period_start, period_end = month_range(date.fromisoformat(start_str), 0)
             period_end = min(period_end, end_date)
-            monthly_txs = [
-                t
-                for t in txs
-                if period_start.isoformat() <= t["Date"] <= period_end.isoformat()
-            ]
-            if not monthly_txs:
-                continue
-            start_balance = monthly_txs[0]["Balance"] - monthly_txs[0]["Amount"]
-            end_balance = monthly_txs[-1]["Balance"]
-
-            stmt = orm.Statements(
-                PluginID=plugin.PluginID,
-                AccountID=account.AccountID,
-                ImportDate=datetime.utcnow().isoformat(),
-                StartDate=period_start.isoformat(),
-                EndDate=period_end.isoformat(),
-                StartBalance=start_balance,
-                EndBalance=end_balance,
-                TransactionCount=len(monthly_txs),
-                Filename=f"{spec.account_number}_{period_start:%Y%m}.csv",
-                MD5=sha_md5(spec.account_number, period_start.isoformat()),
+            start_balance = balances[first] - amounts[first]
+            end_balance = balances[last - 1]
+
+            stmt_rows.append(
+                {
+                    "PluginID": plugin.PluginID,
+                    "AccountID": account.AccountID,
+                    "ImportDate": import_date,
+                    "StartDate": start_str,
+                    "EndDate": period_end.isoformat(),
+                    "StartBalance": start_balance,
+                    "EndBalance": end_balance,
+                    "TransactionCount": last - first,
+                    "Filename": f"{spec.account_number}_{period_start:%Y%m}.csv",
+                    "MD5": synthetic_md5(),
+                }
             )
-            session.add(stmt)
-            session.flush()
-
-            for tx in monthly_txs:
-                desc = tx["Description"]
-                category_id = tx["Category"].CategoryID
-                session.add(
-                    orm.Transactions(
-                        StatementID=stmt.StatementID,
-                        AccountID=account.AccountID,
-                        Date=tx["Date"],
-                        Amount=tx["Amount"],
-                        Balance=tx["Balance"],
-                        Description=desc,
-                        MD5=sha_md5(
-                            tx["Date"], str(tx["Amount"]), spec.account_number, desc
-                        ),
-                        CategoryID=category_id,
-                        Verified=tx["Verified"],
-                        ConfidenceScore=0.9,
-                    )
+
+            # The only per-transaction dicts are the insert parameters themselves
+            tx_rows = tx_rows_by_start[start_str] = [
+                {
+                    "AccountID": account.AccountID,
+                    "Date": tx_date,
+                    "Amount": amount,
+                    "Balance": balance,
+                    "Description": desc,
+                    "MD5": synthetic_md5(),
+                    "CategoryID": category_id,
+                    "Verified": is_verified,
+                    "ConfidenceScore": 0.9,
+                }
+                for tx_date, amount, balance, desc, category_id, is_verified in zip(
+                    dates[first:last],
+                    amounts[first:last],
+                    balances[first:last],
+                    descriptions[first:last],
+                    category_ids_col[first:last],
+                    verified[first:last],
                 )
+            ]
+            first = last
+            pending += len(tx_rows)
+            if pending >= INSERT_BATCH:
+                _insert_statements(session, stmt_rows, tx_rows_by_start)
+                pending = 0
+
+        _insert_statements(session, stmt_rows, tx_rows_by_start)
+
+
+def _insert_statements(
+    session: Session,
+    stmt_rows: list[dict],
+    tx_rows_by_start: dict[str, list[dict]],
+) -> None:
+    """
+    Bulk insert pending statements, then their transactions, and clear both buffers.
+    """
+    if not stmt_rows:
+        return
+    # Core table inserts skip the ORM bulk-persistence layer (about 2x faster here).
+    # RETURNING hands back the new StatementIDs in parameter order, so no re-query.
+    statements = orm.Statements.__table__
+    statement_ids = session.execute(
+        statements.insert().returning(
+            statements.c.StatementID, sort_by_parameter_order=True
+        ),
+        stmt_rows,
+    ).scalars()
+    tx_rows: list[dict] = []
+    for stmt_row, statement_id in zip(stmt_rows, statement_ids):
+        for tx_row in tx_rows_by_start[stmt_row["StartDate"]]:
+            tx_row["StatementID"] = statement_id
+            tx_rows.append(tx_row)
+    session.execute(orm.Transactions.__table__.insert(), tx_rows)
+    stmt_rows.clear()
+    tx_rows_by_start.clear()
+
+
+def _tune_sqlite(session: Session) -> None:
+    """
+    Trade durability for speed while the throwaway DB is built in one transaction.
+    """
+    # An in-memory rollback journal rather than WAL: the whole build is a single
+    # transaction, and WAL mode would stick to the file handed out for demos.
+    session.execute(text("PRAGMA journal_mode=MEMORY"))
+    session.execute(text("PRAGMA synchronous=OFF"))
+    session.execute(text("PRAGMA temp_store=MEMORY"))
+    session.execute(text("PRAGMA cache_size=-200000"))
 
 
 def _set_alembic_version(session: Session) -> None:
@@ -470,23 +606,26 @@ def _reset_tables(session: Session) -> None:
     """
     Clear existing data so reruns don't hit UNIQUE constraints.
     """
-    session.execute(
-        text(
-            """
-            CREATE TABLE IF NOT EXISTS alembic_version (
-                version_num VARCHAR(32) NOT NULL
-            )
-            """
-        )
+    # One DBAPI script rather than a round trip per statement. executescript()
+    # commits any pending transaction first, so the script opens the build's
+    # transaction itself and the session's final commit closes it.
+    dbapi_connection = session.connection().connection.driver_connection
+    dbapi_connection.executescript(
+        """
+        BEGIN;
+        CREATE TABLE IF NOT EXISTS alembic_version (
+            version_num VARCHAR(32) NOT NULL
+        );
+        DELETE FROM Transactions;
+        DELETE FROM Statements;
+        DELETE FROM AccountNumbers;
+        DELETE FROM Accounts;
+        DELETE FROM Categories;
+        DELETE FROM AccountTypes;
+        DELETE FROM Plugins;
+        DELETE FROM alembic_version;
+        """
     )
-    session.execute(text("DELETE FROM Transactions"))
-    session.execute(text("DELETE FROM Statements"))
-    session.execute(text("DELETE FROM AccountNumbers"))
-    session.execute(text("DELETE FROM Accounts"))
-    session.execute(text("DELETE FROM Categories"))
-    session.execute(text("DELETE FROM AccountTypes"))
-    session.execute(text("DELETE FROM Plugins"))
-    session.execute(text("DELETE FROM alembic_version"))
 
 
 def main() -> None:
@@ -505,9 +644,18 @@ def main() -> None:
     parser.add_argument(
         "--seed", type=int, default=1234, help="Random seed for reproducibility."
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help=(
+            "Processes used to simulate accounts (default: 1; only long histories "
+            "outweigh the worker start-up cost)."
+        ),
+    )
     args = parser.parse_args()
 
-    out_path = create_synthetic_db(args.output, args.years, args.seed)
+    out_path = create_synthetic_db(args.output, args.years, args.seed, args.workers)
     print(f"Synthetic database created at {out_path.resolve()}")
 
 